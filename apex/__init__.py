@@ -24,6 +24,10 @@ All agents support:
     agent.serve(port=8001)          # Start server
     agent.export("./output")        # Export as skill folder
     await agent.register(url)       # Register with registry
+    await apex.shutdown()           # Close shared HTTP connections
+
+Faster event loop (uvloop, if installed):
+    apex.install_fast_loop()        # Call before asyncio.run()
 
 Payments:
     from apex.payments import Wallet
@@ -53,6 +57,12 @@ from .buyer import Buyer, create_buyer, NegotiationResult
 # Low-level client
 from .client import Client
 
+# Shared HTTP connections
+from ._http import shutdown
+
+# Runtime
+from .runtime import install_fast_loop
+
 # Negotiation internals
 from .negotiation import NegotiationEngine, NegotiationState
 
@@ -86,6 +96,12 @@ __all__ = [
     # Client
     "Client",
     
+    # Shared HTTP connections
+    "shutdown",
+    
+    # Runtime
+    "install_fast_loop",
+    
     # Negotiation
     "NegotiationEngine",
     "NegotiationState",
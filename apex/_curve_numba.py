@@ -0,0 +1,54 @@
+"""Batch concession-curve kernel for negotiation simulations and sweeps.
+
+Vectorized counterpart of `Buyer._curve_counter`: computes the buyer's next
+offer for many negotiations at once. Compiled with Numba when installed
+(pip install apex-protocol[sim]), plain NumPy otherwise.
+
+Example:
+    from apex._curve_numba import curve_counter_batch
+
+    offers = curve_counter_batch(
+        my_offers=[10.0, 12.0],
+        seller_offers=[20.0, 18.0],
+        budgets=[18.0, 18.0],
+        risks=0.6,
+        progress=[0.2, 0.4],
+    )
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+def _curve_counter_kernel(my, sel, bud, risk, prog):
+    room = np.minimum(bud, sel) - my
+    concession = room * -np.expm1(-risk * prog * 3.0)
+    return np.minimum(my + concession, bud)
+
+
+if njit is not None:
+    _curve_counter_kernel = njit(cache=True, fastmath=True)(_curve_counter_kernel)
+
+
+def curve_counter_batch(my_offers, seller_offers, budgets, risks, progress) -> np.ndarray:
+    """Next buyer offers for a batch of negotiations.
+
+    Args:
+        my_offers: Buyer's current offers
+        seller_offers: Seller's current asks
+        budgets: Buyer budgets
+        risks: Risk tolerance per negotiation (0.3 firm, 0.6 balanced, 0.85 flexible)
+        progress: round_num / max_rounds per negotiation
+
+    Scalars broadcast against arrays. Returns offers rounded to cents, matching
+    the scalar `Buyer._curve_counter`.
+    """
+    arrays = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (my_offers, seller_offers, budgets, risks, progress))
+    )
+    my, sel, bud, risk, prog = (np.ascontiguousarray(a) for a in arrays)
+    return np.round(_curve_counter_kernel(my, sel, bud, risk, prog), 2)
@@ -0,0 +1,87 @@
+"""Shared httpx clients.
+
+httpx.AsyncClient connection pools are bound to the event loop they were first
+used on, so clients are cached per running loop and per name. Call
+`apex.shutdown()` before the loop exits to close them.
+"""
+
+import asyncio
+import weakref
+from importlib.util import find_spec
+from typing import Callable
+
+import httpx
+
+# httpx only speaks HTTP/2 with the h2 package (pip install apex-protocol[fast])
+HTTP2 = find_spec("h2") is not None
+
+# loop -> {name: client}
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client(name: str, factory: Callable[[], httpx.AsyncClient]) -> httpx.AsyncClient:
+    """Get the shared client called `name` for the running loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    clients = _clients.get(loop)
+    if clients is None:
+        clients = _clients[loop] = {}
+
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        client = clients[name] = factory()
+    return client
+
+
+async def close_client(name: str):
+    """Close the shared client called `name` on the running loop, if one is open.
+
+    The next get_client(name, ...) call creates a fresh one.
+    """
+    clients = _clients.get(asyncio.get_running_loop())
+    client = clients.pop(name, None) if clients else None
+    if client is not None:
+        await client.aclose()
+
+
+async def shutdown():
+    """Close every shared client opened on the running loop."""
+    clients = _clients.pop(asyncio.get_running_loop(), None)
+    if clients:
+        await asyncio.gather(
+            *(client.aclose() for client in clients.values()),
+            return_exceptions=True,
+        )
+
+
+def _llm_http_client() -> httpx.AsyncClient:
+    """Pooled connections to the LLM providers, shared on an event loop."""
+    return httpx.AsyncClient(
+        http2=HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
+    )
+
+
+# loop -> {provider: (http client, SDK client)}
+_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+
+
+def get_llm_client(provider: str):
+    """Async OpenAI/Anthropic client for the running loop, shared by buyers and estimation.
+
+    The SDK clients sit on the shared "llm" httpx pool, so shutdown() closes
+    their connections; they are rebuilt if that pool was replaced.
+    """
+    http = get_client("llm", _llm_http_client)
+    clients = _llm_clients.setdefault(asyncio.get_running_loop(), {})
+    entry = clients.get(provider)
+    if entry is None or entry[0] is not http:
+        if provider == "anthropic":
+            import anthropic
+            sdk = anthropic.AsyncAnthropic(http_client=http)
+        else:
+            from openai import AsyncOpenAI
+            sdk = AsyncOpenAI(http_client=http)
+        entry = clients[provider] = (http, sdk)
+    return entry[1]
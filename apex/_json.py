@@ -0,0 +1,43 @@
+"""JSON encoding helpers.
+
+Uses orjson when installed (pip install apex-protocol[fast]) and falls back
+to the standard library otherwise. `dumps` always returns compact UTF-8 bytes.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+
+def has_json_object(text: str) -> bool:
+    """True once text contains a complete JSON object (for cutting LLM streams short)."""
+    start = text.find("{")
+    if start < 0:
+        return False
+    try:
+        loads(text[start:text.rfind("}") + 1])
+    except JSONDecodeError:
+        return False
+    return True
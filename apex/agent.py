@@ -17,20 +17,81 @@ Example:
     agent.serve(port=8001)
 """
 
+import asyncio
+import secrets
+import time
 import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib.util import find_spec
+from types import MappingProxyType
 from typing import Any, Callable, Optional, Union, TYPE_CHECKING
 
+import httpx
+
+from . import _http, _json
 from .pricing import Pricing, Fixed, Negotiated
 from .negotiation import NegotiationEngine, NegotiationState
 from .estimation import estimate_task, EstimateCache, EstimateResult
 from .export import export_agent
 
+try:
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Route
+    _HAS_SERVER = True
+except ImportError:  # pragma: no cover - core deps, but keep import apex working
+    _HAS_SERVER = False
+
+# Optional C-accelerated event loop / HTTP parser for serve()
+_HAS_UVLOOP = find_spec("uvloop") is not None
+_HAS_HTTPTOOLS = find_spec("httptools") is not None
+
 if TYPE_CHECKING:
     from .payments import Wallet
 
+# Shared read-only default for requests without params
+_EMPTY = MappingProxyType({})
+
+
+def _registry_client() -> httpx.AsyncClient:
+    """Client for registry calls: fail fast on connect, keep a few connections warm."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_langchain() -> Optional[tuple]:
+    """Import the LangChain classes once per process (None if not installed).
+    
+    Kept lazy rather than at module top so `import apex` stays fast for
+    handler-only agents that never touch LangChain.
+    """
+    try:
+        from langchain_openai import ChatOpenAI
+        from langchain.agents import AgentExecutor, create_openai_functions_agent
+        from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+    except ImportError:
+        return None
+    return ChatOpenAI, AgentExecutor, create_openai_functions_agent, ChatPromptTemplate, MessagesPlaceholder
+
 
-@dataclass
+@dataclass(slots=True)
+class _Negotiation:
+    """An in-flight negotiation tracked by the agent."""
+    
+    engine: NegotiationEngine
+    touched_at: float
+    input: Optional[dict] = None  # sent once with apex/propose (job cache)
+
+
+@dataclass(slots=True)
 class Agent:
     """APEX Agent instance."""
     
@@ -47,37 +108,70 @@ class Agent:
     
     # Internal
     _handler: Optional[Callable] = None
-    _negotiation_engines: Optional[dict] = None  # job_id -> NegotiationEngine
+    _negotiation_engines: Optional[OrderedDict] = None  # job_id -> _Negotiation, LRU order
+    _max_negotiations: int = 10_000
+    _negotiation_ttl_s: float = 600.0
     _estimate_cache: Optional[EstimateCache] = None  # estimate_id -> EstimateResult
     _langchain_agent: Any = None
     _langchain_initialized: bool = False
+    _langchain_lock: Optional[asyncio.Lock] = field(default=None, init=False, repr=False)
+    _wallet_address: str = field(default="", init=False, repr=False)
+    _price_dict: Optional[dict] = field(default=None, init=False, repr=False)
+    _price_currency: str = field(default="USDC", init=False, repr=False)
+    _price_display: str = field(default="", init=False, repr=False)
+    _price_cents: int = field(default=0, init=False, repr=False)
+    _discover_cache: Optional[dict] = field(default=None, init=False, repr=False)
+    _discover_cache_bytes: Optional[bytes] = field(default=None, init=False, repr=False)
+    _method_table: Optional[dict] = field(default=None, init=False, repr=False)
+    # Set by from_api/from_curl/load (slots need every attribute declared)
+    _client_name: Optional[str] = field(default=None, init=False, repr=False)  # handler's per-loop client in _http
+    _source_type: Optional[str] = field(default=None, init=False, repr=False)
+    _source_config: dict = field(default_factory=dict, init=False, repr=False)
     
     def __post_init__(self):
         # Generate agent_id if not provided
         if self.agent_id is None:
             slug = self.name.lower().replace(" ", "-")
-            self.agent_id = f"{slug}-{uuid.uuid4().hex[:8]}"
+            self.agent_id = f"{slug}-{secrets.token_hex(4)}"
         
         # Generate mock wallet if not provided
         if self.wallet is None:
-            self.wallet = "0x" + uuid.uuid4().hex[:40]
+            self.wallet = "0x" + secrets.token_hex(20)
+        self._wallet_address = self.wallet if isinstance(self.wallet, str) else self.wallet.address
         
         # Generate capabilities if not provided
         if not self.capabilities:
             self.capabilities = [self.name.lower().replace(" ", "-")]
         
-        # Initialize negotiation engines dict
-        self._negotiation_engines = {}
+        # Initialize negotiation engines (bounded LRU)
+        self._negotiation_engines = OrderedDict()
         
         # Initialize estimate cache
         self._estimate_cache = EstimateCache()
+        
+        # Price info is fixed after construction - derive display/wire forms once
+        self._price_dict = self.price.to_dict()
+        self._price_currency = getattr(self.price, "currency", "USDC")
+        self._price_display = self._format_price()
+        self._price_cents = round(self.price.amount * 100) if isinstance(self.price, Fixed) else 0
+        
+        # Discovery info is fixed after construction - build and serialize it once
+        self._discover_cache = self._build_discover_result()
+        self._discover_cache_bytes = _json.dumps(self._discover_cache)
+        
+        # JSON-RPC method -> handler(request_id, params)
+        self._method_table = {
+            "apex/discover": self._handle_discover,
+            "apex/estimate": self._handle_estimate,
+            "apex/propose": self._handle_propose,
+            "apex/counter": self._handle_counter,
+            "apex/accept": self._handle_accept,
+        }
     
     @property
     def wallet_address(self) -> str:
         """Get wallet address (works for both mock string and real Wallet)."""
-        if isinstance(self.wallet, str):
-            return self.wallet
-        return self.wallet.address
+        return self._wallet_address
     
     async def balance(self) -> Optional[float]:
         """Get USDC balance (if real wallet)."""
@@ -87,9 +181,11 @@ class Agent:
     
     def _get_negotiation_engine(self, job_id: str, task_context: dict = None) -> NegotiationEngine:
         """Get or create negotiation engine for a job (legacy - uses static bounds)."""
-        if job_id not in self._negotiation_engines:
-            self._negotiation_engines[job_id] = NegotiationEngine(self.price, task_context=task_context)
-        return self._negotiation_engines[job_id]
+        engine = self._lookup_engine(job_id)
+        if engine is None:
+            engine = NegotiationEngine(self.price, task_context=task_context)
+            self._store_engine(job_id, engine)
+        return engine
     
     def _get_or_create_engine(
         self, 
@@ -99,57 +195,97 @@ class Agent:
         task_context: dict = None,
     ) -> NegotiationEngine:
         """Get or create negotiation engine with dynamic bounds."""
-        if job_id not in self._negotiation_engines:
+        engine = self._lookup_engine(job_id)
+        if engine is None:
             # Create a temporary Negotiated with dynamic bounds
             dynamic_pricing = Negotiated(
                 target=target,
                 minimum=minimum,
                 max_rounds=self.price.max_rounds if isinstance(self.price, Negotiated) else 5,
-                currency=self.price.currency if hasattr(self.price, 'currency') else "USDC",
+                currency=self._price_currency,
                 strategy=self.price.strategy if isinstance(self.price, Negotiated) else None,
                 model=self.price.model if isinstance(self.price, Negotiated) else None,
                 instructions=self.price.instructions if isinstance(self.price, Negotiated) else [],
             )
-            self._negotiation_engines[job_id] = NegotiationEngine(dynamic_pricing, task_context=task_context)
-        return self._negotiation_engines[job_id]
+            engine = NegotiationEngine(dynamic_pricing, task_context=task_context)
+            self._store_engine(job_id, engine)
+        return engine
+    
+    def _lookup_engine(self, job_id: str) -> Optional[NegotiationEngine]:
+        """Return the live engine for job_id (refreshing its LRU position), or None."""
+        now = time.monotonic()
+        self._evict_expired(now)
+        entry = self._negotiation_engines.get(job_id)
+        if entry is None:
+            return None
+        entry.touched_at = now
+        self._negotiation_engines.move_to_end(job_id)
+        return entry.engine
     
-    def _init_langchain_agent(self):
-        """Initialize LangChain agent (lazy - only when first needed)."""
+    def _store_engine(self, job_id: str, engine: NegotiationEngine):
+        """Track a new negotiation, evicting the least recently used past the cap."""
+        engines = self._negotiation_engines
+        engines[job_id] = _Negotiation(engine, time.monotonic())
+        engines.move_to_end(job_id)
+        while len(engines) > self._max_negotiations:
+            engines.popitem(last=False)
+    
+    def _evict_expired(self, now: float):
+        """Drop negotiations idle for longer than the TTL (oldest are first)."""
+        engines = self._negotiation_engines
+        cutoff = now - self._negotiation_ttl_s
+        while engines:
+            entry = next(iter(engines.values()))
+            if entry.touched_at > cutoff:
+                break
+            engines.popitem(last=False)
+    
+    async def _init_langchain_agent(self):
+        """Initialize LangChain agent once (lazy - only when first needed)."""
         if self._langchain_initialized:
             return
         
-        self._langchain_initialized = True
+        if self._langchain_lock is None:
+            self._langchain_lock = asyncio.Lock()
         
+        async with self._langchain_lock:
+            # Another request may have finished initialization while we waited
+            if self._langchain_initialized:
+                return
+            self._build_langchain_agent()
+            self._langchain_initialized = True
+    
+    def _build_langchain_agent(self):
+        """Build the LangChain runnable from instructions and tools."""
         if not self.instructions:
             return
         
-        try:
-            from langchain_openai import ChatOpenAI
-            from langchain.agents import AgentExecutor, create_openai_functions_agent
-            from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-            
-            # Build system prompt from instructions
-            system_prompt = "\n".join(self.instructions)
-            
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", system_prompt),
-                MessagesPlaceholder(variable_name="chat_history", optional=True),
-                ("human", "{input}"),
-                MessagesPlaceholder(variable_name="agent_scratchpad"),
-            ])
-            
-            llm = ChatOpenAI(model=self.model)
-            
-            if self.tools:
-                agent = create_openai_functions_agent(llm, self.tools, prompt)
-                self._langchain_agent = AgentExecutor(agent=agent, tools=self.tools)
-            else:
-                # Simple chain without tools
-                self._langchain_agent = prompt | llm
-                
-        except ImportError:
+        classes = _load_langchain()
+        if classes is None:
             print("Warning: langchain not installed. Install with: pip install apex-protocol[llm]")
             self._langchain_agent = None
+            return
+        
+        ChatOpenAI, AgentExecutor, create_openai_functions_agent, ChatPromptTemplate, MessagesPlaceholder = classes
+        
+        # Build system prompt from instructions
+        system_prompt = "\n".join(self.instructions)
+        
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", system_prompt),
+            MessagesPlaceholder(variable_name="chat_history", optional=True),
+            ("human", "{input}"),
+            MessagesPlaceholder(variable_name="agent_scratchpad"),
+        ])
+        
+        llm = ChatOpenAI(model=self.model)
+        
+        if self.tools:
+            agent = create_openai_functions_agent(llm, self.tools, prompt)
+            self._langchain_agent = AgentExecutor(agent=agent, tools=self.tools)
+        else:
+            # Simple chain without tools
+            self._langchain_agent = prompt | llm
     
     async def run(self, input: dict) -> dict:
         """Execute the agent with given input."""
@@ -158,7 +294,7 @@ class Agent:
         
         # Lazy initialize LangChain
         if not self._langchain_initialized:
-            self._init_langchain_agent()
+            await self._init_langchain_agent()
         
         if self._langchain_agent is None:
             raise RuntimeError("No handler or LangChain agent configured")
@@ -184,33 +320,36 @@ class Agent:
     
     async def handle(self, request: dict) -> dict:
         """Handle an APEX protocol request."""
-        method = request.get("method", "")
-        params = request.get("params", {})
-        request_id = request.get("id", "1")
+        get = request.get
+        method = get("method") or ""
+        params = get("params") or _EMPTY
+        request_id = get("id", "1")
         
         try:
-            if method == "apex/discover":
-                return self._make_response(request_id, self._get_discover_result())
-            
-            elif method == "apex/estimate":
-                return await self._handle_estimate(request_id, params)
-            
-            elif method == "apex/propose":
-                return await self._handle_propose(request_id, params)
-            
-            elif method == "apex/counter":
-                return await self._handle_counter(request_id, params)
-            
-            elif method == "apex/accept":
-                return await self._handle_accept(request_id, params)
-            
-            else:
+            handler = self._method_table.get(method)
+            if handler is None:
                 return self._make_error(request_id, -32601, f"Method not found: {method}")
+            return await handler(request_id, params)
         
         except Exception as e:
             return self._make_error(request_id, -32603, str(e))
     
+    async def _handle_discover(self, request_id: str, params: dict) -> dict:
+        """Handle apex/discover request."""
+        return self._make_response(request_id, self._discover_cache)
+    
     def _get_discover_result(self) -> dict:
+        """Get discovery result (cached at construction; do not mutate)."""
+        return self._discover_cache
+    
+    def _discover_response_bytes(self, request_id: Any) -> bytes:
+        """Serialized apex/discover response, spliced around the cached result."""
+        return (
+            b'{"jsonrpc":"2.0","id":' + _json.dumps(request_id)
+            + b',"result":' + self._discover_cache_bytes + b"}"
+        )
+    
+    def _build_discover_result(self) -> dict:
         """Build discovery result."""
         return {
             "agent": {
@@ -219,14 +358,16 @@ class Agent:
                 "description": self.description,
             },
             "capabilities": [
-                {"id": cap, "name": cap, "pricing": self.price.to_dict()}
+                {"id": cap, "name": cap, "pricing": self._price_dict}
                 for cap in self.capabilities
             ],
             "payment": {
                 "networks": ["base"],
-                "currencies": [self.price.currency if hasattr(self.price, 'currency') else "USDC"],
-                "address": self.wallet_address,
+                "currencies": [self._price_currency],
+                "address": self._wallet_address,
             },
+            # Buyers may omit "input" on apex/counter and apex/accept; we keep it per job_id
+            "features": {"job_cache": True},
         }
     
     async def _handle_estimate(self, request_id: str, params: dict) -> dict:
@@ -241,7 +382,7 @@ class Agent:
                 "message": "Fixed pricing - no estimation needed",
                 "price": {
                     "amount": self.price.amount,
-                    "currency": self.price.currency,
+                    "currency": self._price_currency,
                 },
             })
         
@@ -251,12 +392,12 @@ class Agent:
                 # Legacy mode - return static bounds
                 return self._make_response(request_id, {
                     "status": "estimated",
-                    "estimate_id": f"est-static-{uuid.uuid4().hex[:8]}",
+                    "estimate_id": f"est-static-{secrets.token_hex(4)}",
                     "estimate": {
                         "amount": self.price.target,
                         "low": self.price.minimum,
                         "high": self.price.target * 1.2,
-                        "currency": self.price.currency,
+                        "currency": self._price_currency,
                     },
                     "negotiation": {
                         "target": self.price.target,
@@ -284,7 +425,7 @@ class Agent:
         """Handle apex/propose request."""
         offer_amount = params.get("offer", {}).get("amount", 0)
         input_data = params.get("input", {})
-        job_id = params.get("job_id", str(uuid.uuid4()))
+        job_id = params.get("job_id") or str(uuid.uuid4())
         estimate_id = params.get("estimate_id")
         
         # Handle negotiated pricing
@@ -333,51 +474,26 @@ class Agent:
             
             # Create negotiation engine with dynamic bounds and task context
             engine = self._get_or_create_engine(job_id, target, minimum, task_context=task_context)
-            state, counter = engine.receive_offer(offer_amount)
-            
-            if state == NegotiationState.ACCEPTED:
-                output = await self.run(input_data)
-                # Clean up engine
-                self._negotiation_engines.pop(job_id, None)
-                return self._make_response(request_id, {
-                    "status": "completed",
-                    "job_id": job_id,
-                    "terms": {"amount": float(offer_amount), "currency": self.price.currency},
-                    "output": output,
-                })
-            
-            elif state == NegotiationState.REJECTED:
-                self._negotiation_engines.pop(job_id, None)
-                return self._make_error(request_id, -32018, "Offer rejected")
-            
-            elif state == NegotiationState.EXPIRED:
-                self._negotiation_engines.pop(job_id, None)
-                return self._make_error(request_id, -32019, "Negotiation expired")
-            
-            elif counter:  # IN_PROGRESS with counter
-                return self._make_response(request_id, {
-                    "status": "counter",
-                    "job_id": job_id,
-                    "offer": {"amount": float(counter.price), "currency": self.price.currency},
-                    "round": counter.round,
-                    "max_rounds": self.price.max_rounds,
-                    "reason": counter.reason,
-                })
+            self._negotiation_engines[job_id].input = input_data
+            return await self._process_negotiation_offer(
+                request_id, job_id, offer_amount, input_data, engine, "Offer rejected"
+            )
         
         # Handle fixed pricing
         elif isinstance(self.price, Fixed):
-            if offer_amount >= self.price.amount:
+            # Compare in integer cents so 4.9999999 counts as 5.00
+            if int(offer_amount * 100 + 0.5) >= self._price_cents:
                 output = await self.run(input_data)
                 return self._make_response(request_id, {
                     "status": "completed",
                     "job_id": job_id,
-                    "terms": {"amount": self.price.amount, "currency": self.price.currency},
+                    "terms": {"amount": self.price.amount, "currency": self._price_currency},
                     "output": output,
                 })
             else:
                 return self._make_error(
                     request_id, -32017,
-                    f"Price is {self.price.amount} {self.price.currency}"
+                    f"Price is {self.price.amount} {self._price_currency}"
                 )
         
     
@@ -388,37 +504,53 @@ class Agent:
         
         offer_amount = params.get("offer", {}).get("amount", 0)
         job_id = params.get("job_id", "")
-        input_data = params.get("input", {})
         
-        if not job_id or job_id not in self._negotiation_engines:
+        engine = self._lookup_engine(job_id) if job_id else None
+        if engine is None:
             return self._make_error(request_id, -32008, "Unknown job_id")
         
-        engine = self._negotiation_engines[job_id]
+        input_data = self._job_input(job_id, params)
+        
+        return await self._process_negotiation_offer(
+            request_id, job_id, offer_amount, input_data, engine, "Negotiation ended - no agreement"
+        )
+    
+    async def _process_negotiation_offer(
+        self,
+        request_id: str,
+        job_id: str,
+        offer_amount: float,
+        input_data: dict,
+        engine: NegotiationEngine,
+        reject_message: str,
+    ) -> dict:
+        """Feed a buyer offer to the engine and build the propose/counter response."""
         state, counter = engine.receive_offer(offer_amount)
         
         if state == NegotiationState.ACCEPTED:
             output = await self.run(input_data)
+            # Clean up engine
             self._negotiation_engines.pop(job_id, None)
             return self._make_response(request_id, {
                 "status": "completed",
                 "job_id": job_id,
-                "terms": {"amount": float(offer_amount), "currency": self.price.currency},
+                "terms": {"amount": float(offer_amount), "currency": self._price_currency},
                 "output": output,
             })
         
         elif state == NegotiationState.REJECTED:
             self._negotiation_engines.pop(job_id, None)
-            return self._make_error(request_id, -32018, "Negotiation ended - no agreement")
+            return self._make_error(request_id, -32018, reject_message)
         
         elif state == NegotiationState.EXPIRED:
             self._negotiation_engines.pop(job_id, None)
             return self._make_error(request_id, -32019, "Negotiation expired")
         
-        elif counter:
+        elif counter:  # IN_PROGRESS with counter
             return self._make_response(request_id, {
                 "status": "counter",
                 "job_id": job_id,
-                "offer": {"amount": float(counter.price), "currency": self.price.currency},
+                "offer": {"amount": float(counter.price), "currency": self._price_currency},
                 "round": counter.round,
                 "max_rounds": self.price.max_rounds,
                 "reason": counter.reason,
@@ -428,7 +560,9 @@ class Agent:
         """Handle apex/accept (buyer accepting our counter)."""
         job_id = params.get("job_id", "")
         terms = params.get("terms", {})
-        input_data = params.get("input", {})
+        input_data = self._job_input(job_id, params)
+        if input_data is None:
+            return self._make_error(request_id, -32020, "Input required - job_id not cached")
         
         output = await self.run(input_data)
         
@@ -442,6 +576,14 @@ class Agent:
             "output": output,
         })
     
+    def _job_input(self, job_id: str, params: dict) -> Optional[dict]:
+        """Input sent with this request, else the one cached at apex/propose (None if neither)."""
+        input_data = params.get("input")
+        if input_data is None:
+            entry = self._negotiation_engines.get(job_id)
+            input_data = entry.input if entry is not None else None
+        return input_data
+    
     def _make_response(self, request_id: str, result: dict) -> dict:
         """Create JSON-RPC response."""
         return {
@@ -460,54 +602,41 @@ class Agent:
     
     async def register(self, registry_url: str) -> dict:
         """Register this agent with a registry."""
-        import httpx
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{registry_url}/api/register",
-                json={
-                    "agent_id": self.agent_id,
-                    "name": self.name,
-                    "description": self.description,
-                    "url": f"http://localhost:8001/apex",  # Will be updated in serve()
-                    "capabilities": self.capabilities,
-                    "networks": ["base"],
-                    "currencies": ["USDC"],
-                    "wallet_address": self.wallet_address,
-                    "pricing_info": self.price.to_dict(),
-                    "tags": self.tags,
-                },
-                timeout=10.0,
-            )
-            
-            if response.status_code == 200:
-                print(f"âœ… Registered '{self.name}' with {registry_url}")
-                return response.json()
-            else:
-                raise Exception(f"Registration failed: {response.text}")
-    
-    def serve(self, host: str = "0.0.0.0", port: int = 8001):
-        """Start HTTP server for this agent."""
-        import uvicorn
-        from starlette.applications import Starlette
-        from starlette.requests import Request
-        from starlette.responses import JSONResponse
-        from starlette.routing import Route
-        
-        agent = self  # Capture for closure
+        client = _http.get_client("registry", _registry_client)
+        response = await client.post(
+            f"{registry_url}/api/register",
+            json={
+                "agent_id": self.agent_id,
+                "name": self.name,
+                "description": self.description,
+                "url": f"http://localhost:8001/apex",  # Will be updated in serve()
+                "capabilities": self.capabilities,
+                "networks": ["base"],
+                "currencies": ["USDC"],
+                "wallet_address": self._wallet_address,
+                "pricing_info": self._price_dict,
+                "tags": self.tags,
+            },
+        )
         
-        async def handle_apex(request: Request) -> JSONResponse:
-            body = await request.json()
-            response = await agent.handle(body)
-            return JSONResponse(response)
+        if response.status_code == 200:
+            print(f"âœ… Registered '{self.name}' with {registry_url}")
+            return response.json()
+        else:
+            raise Exception(f"Registration failed: {response.text}")
+    
+    def serve(self, host: str = "0.0.0.0", port: int = 8001, log_level: str = "warning"):
+        """Start HTTP server for this agent.
         
-        async def health(request: Request) -> JSONResponse:
-            return JSONResponse({"status": "ok", "agent": agent.name})
+        Uses uvloop and httptools when installed (pip install apex-protocol[server]),
+        falling back to uvicorn's defaults otherwise.
+        """
+        if not _HAS_SERVER:
+            raise RuntimeError(
+                "serve() requires starlette and uvicorn. Install with: pip install apex-protocol"
+            )
         
-        app = Starlette(routes=[
-            Route("/apex", handle_apex, methods=["POST"]),
-            Route("/health", health, methods=["GET"]),
-        ])
+        app = _create_app(self)
         
         print(f"""
 â•”â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•—
@@ -516,11 +645,23 @@ class Agent:
 â•‘  ID:     {self.agent_id:<52} â•‘
 â•‘  URL:    http://{host}:{port}/apex{' ' * (41 - len(str(port)))} â•‘
 â•‘  Wallet: {self.wallet_address[:20]}...{' ' * 30} â•‘
-â•‘  Price:  {self._format_price():<52} â•‘
+â•‘  Price:  {self._price_display:<52} â•‘
 â•šâ•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
 """)
         
-        uvicorn.run(app, host=host, port=port)
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            loop="uvloop" if _HAS_UVLOOP else "auto",
+            http="httptools" if _HAS_HTTPTOOLS else "auto",
+            log_level=log_level,
+        )
+    
+    async def aclose(self):
+        """Close the HTTP client owned by this agent's handler on the running loop, if any."""
+        if self._client_name is not None:
+            await _http.close_client(self._client_name)
     
     def export(self, path: str):
         """Export this agent as a skill folder.
@@ -545,6 +686,39 @@ class Agent:
         return "Unknown"
 
 
+def _create_app(agent: Agent) -> "Starlette":
+    """Build the ASGI app that exposes an agent over HTTP."""
+    
+    async def handle_apex(request: Request) -> Response:
+        body = _json.loads(await request.body())
+        if body.get("method") == "apex/discover":
+            return Response(
+                agent._discover_response_bytes(body.get("id", "1")),
+                media_type="application/json",
+            )
+        response = await agent.handle(body)
+        return Response(_json.dumps(response), media_type="application/json")
+    
+    health_body = _json.dumps({"status": "ok", "agent": agent.name})
+    
+    async def health(request: Request) -> Response:
+        return Response(health_body, media_type="application/json")
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await agent.aclose()
+        await _http.shutdown()
+    
+    return Starlette(
+        routes=[
+            Route("/apex", handle_apex, methods=["POST"]),
+            Route("/health", health, methods=["GET"]),
+        ],
+        lifespan=lifespan,
+    )
+
+
 def create_agent(
     name: str,
     price: Pricing,
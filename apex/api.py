@@ -20,8 +20,11 @@ from typing import Any
 
 import httpx
 
+from ._http import HTTP2, get_client
 from .pricing import Pricing, Fixed
 
+_TEMPLATE_RE = re.compile(r"\{\{(.+?)\}\}")
+
 
 def from_api(
     name: str,
@@ -68,32 +71,14 @@ def from_api(
     """
     from .agent import Agent
     
-    # Create handler that calls the API
-    async def api_handler(input_data: dict) -> dict:
-        context = {"input": input_data, "env": dict(os.environ)}
-        
-        # Substitute templates
-        req_headers = _substitute(headers or {}, context)
-        req_body = _substitute(body, context) if body else None
-        req_params = _substitute(params or {}, context)
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method=method,
-                url=endpoint,
-                headers=req_headers,
-                json=req_body,
-                params=req_params,
-            )
-            response.raise_for_status()
-            response_data = response.json()
-        
-        # Extract output if path specified
-        if output:
-            result = _extract_path(response_data, output)
-            return {"result": result}
-        
-        return {"result": response_data}
+    # Parse templates once; requests only fill in the placeholders
+    compiled_headers = _compile_template(headers or {})
+    compiled_body = _compile_template(body) if body else None
+    compiled_params = _compile_template(params or {})
+    
+    # Split the output path once; single keys ("data", "result") skip the walk
+    output_parts = _compile_path(output) if output else ()
+    output_key = output_parts[0][0] if len(output_parts) == 1 else None
     
     agent = Agent(
         name=name,
@@ -104,7 +89,37 @@ def from_api(
         wallet=wallet,
     )
     
+    # One connection pool per agent and event loop, created on first request
+    # and closed by agent.aclose() / apex.shutdown()
+    client_name = f"api:{agent.agent_id}"
+    
+    # Create handler that calls the API
+    async def api_handler(input_data: dict) -> dict:
+        req_headers = _render(compiled_headers, input_data)
+        req_body = _render(compiled_body, input_data) if body else None
+        req_params = _render(compiled_params, input_data)
+        
+        client = get_client(client_name, _api_client)
+        response = await client.request(
+            method=method,
+            url=endpoint,
+            headers=req_headers,
+            json=req_body,
+            params=req_params,
+        )
+        response.raise_for_status()
+        response_data = response.json()
+        
+        # Extract output if path specified
+        if output_parts:
+            if output_key is not None and isinstance(response_data, dict):
+                return {"result": response_data.get(output_key)}
+            return {"result": _extract_parts(response_data, output_parts)}
+        
+        return {"result": response_data}
+    
     agent._handler = api_handler
+    agent._client_name = client_name
     agent._source_type = "api"
     agent._source_config = {
         "endpoint": endpoint,
@@ -118,48 +133,123 @@ def from_api(
     return agent
 
 
-def _substitute(template: Any, context: dict) -> Any:
-    """Substitute {{variable}} placeholders in template."""
+def _api_client() -> httpx.AsyncClient:
+    """Pooled client for an API-wrapping agent."""
+    return httpx.AsyncClient(
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        http2=HTTP2,
+    )
+
+
+class _CompiledStr:
+    """A template string pre-split into literal, env and path segments."""
+    
+    __slots__ = ("parts",)
+    
+    def __init__(self, parts: list[tuple[str, Any]]):
+        self.parts = parts
+
+
+class _Static:
+    """A template (sub)tree with no placeholders; _render returns it as-is."""
+    
+    __slots__ = ("value",)
+    
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def _compile_template(template: Any) -> Any:
+    """Pre-parse {{variable}} placeholders so rendering skips the regex.
+    
+    Parts without placeholders compile to _Static, so rendering them is a
+    single attribute read instead of a walk that rebuilds the same values.
+    """
     if isinstance(template, str):
-        def replace(match):
+        if "{{" not in template or not _TEMPLATE_RE.search(template):
+            return _Static(template)
+        
+        parts: list[tuple[str, Any]] = []
+        pos = 0
+        for match in _TEMPLATE_RE.finditer(template):
+            if match.start() > pos:
+                parts.append(("lit", template[pos:match.start()]))
             path = match.group(1).strip()
-            
-            # Handle env variables
             if path.startswith("env."):
-                env_var = path[4:]
-                return os.environ.get(env_var, "")
-            
-            # Navigate path (e.g., input.query)
-            parts = path.split(".")
-            value = context
-            for part in parts:
-                if isinstance(value, dict):
-                    value = value.get(part, "")
-                else:
-                    value = ""
-                    break
-            return str(value) if value else ""
-        
-        return re.sub(r"\{\{(.+?)\}\}", replace, template)
+                parts.append(("env", path[4:]))
+            else:
+                parts.append(("path", tuple(path.split("."))))
+            pos = match.end()
+        if pos < len(template):
+            parts.append(("lit", template[pos:]))
+        return _CompiledStr(parts)
     
     elif isinstance(template, dict):
-        return {k: _substitute(v, context) for k, v in template.items()}
+        compiled = {k: _compile_template(v) for k, v in template.items()}
+        if all(isinstance(v, _Static) for v in compiled.values()):
+            return _Static(template)
+        return compiled
     
     elif isinstance(template, list):
-        return [_substitute(item, context) for item in template]
+        compiled = [_compile_template(item) for item in template]
+        if all(isinstance(item, _Static) for item in compiled):
+            return _Static(template)
+        return compiled
     
-    return template
+    return _Static(template)
+
+
+def _render(compiled: Any, input_data: dict) -> Any:
+    """Render a template produced by _compile_template against input data."""
+    if isinstance(compiled, _Static):
+        return compiled.value
+    
+    elif isinstance(compiled, _CompiledStr):
+        out = []
+        for kind, ref in compiled.parts:
+            if kind == "lit":
+                out.append(ref)
+            elif kind == "env":
+                out.append(os.environ.get(ref, ""))
+            else:
+                out.append(_resolve(ref, input_data))
+        return "".join(out)
+    
+    elif isinstance(compiled, dict):
+        return {k: _render(v, input_data) for k, v in compiled.items()}
+    
+    # list with at least one placeholder
+    return [_render(item, input_data) for item in compiled]
+
+
+def _resolve(path: tuple[str, ...], input_data: dict) -> str:
+    """Resolve a placeholder path (e.g. ("input", "city")) to a string."""
+    if path[0] != "input":
+        return ""
+    value: Any = input_data
+    for part in path[1:]:
+        if isinstance(value, dict):
+            value = value.get(part, "")
+        else:
+            value = ""
+            break
+    return str(value) if value else ""
+
+
+def _compile_path(path: str) -> tuple[tuple[str, int | None], ...]:
+    """Split a dot path once into (key, list index or None) parts."""
+    return tuple((part, int(part) if part.isdigit() else None) for part in path.split("."))
 
 
-def _extract_path(data: dict, path: str) -> Any:
-    """Extract value from nested dict using dot notation."""
-    parts = path.split(".")
+def _extract_parts(data: Any, parts: tuple[tuple[str, int | None], ...]) -> Any:
+    """Extract value from nested dicts/lists along a path from _compile_path."""
     value = data
-    for part in parts:
+    for part, index in parts:
         if isinstance(value, dict):
             value = value.get(part)
-        elif isinstance(value, list) and part.isdigit():
-            value = value[int(part)]
+        elif index is not None and isinstance(value, list):
+            value = value[index]
         else:
             return None
     return value
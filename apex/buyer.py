@@ -25,16 +25,24 @@ Example:
             print(result.output)
 """
 
-import uuid
+import array
+import asyncio
+import io
+import itertools
+import random
+import re
+import secrets
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from decimal import Decimal
-from typing import Callable, Literal, Optional, TYPE_CHECKING
+from typing import Callable, Literal, Optional, Union, TYPE_CHECKING
 import math
 
 import httpx
 
+from . import _json
+from ._http import HTTP2, get_client, get_llm_client
 from .negotiation import _load_env
 
 if TYPE_CHECKING:
@@ -55,13 +63,245 @@ class _C:
     CYAN = "\033[96m"
 
 
-def _type_text(text: str, delay: float = 0.012):
-    """Print text with typing effect."""
-    for char in text:
-        sys.stdout.write(char)
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+async def _atype_text(text: str, delay: float = 0.012, chunk: int = 4):
+    """Print text with typing effect without blocking the event loop.
+    
+    Writes `chunk` characters per flush/sleep rather than one, which looks the
+    same at typing speed but costs a quarter of the syscalls and wakeups.
+    """
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    step = delay * chunk
+    for i in range(0, len(text), chunk):
+        write(text[i:i + chunk])
+        flush()
+        await asyncio.sleep(step)
+    write("\n")
+    flush()
+
+
+# JSON-RPC ids only need to be unique per connection
+_next_rpc_id = itertools.count(1).__next__
+
+# Job ids for buyers without a real wallet. Sellers key negotiations by job_id
+# across all their buyers, so the prefix is random per process rather than a pid.
+_MOCK_JOB_PREFIX = "mock-" + secrets.token_hex(8)
+_MOCK_JOB_SEQ = itertools.count(1)
+
+# Request envelope; only the id, method and serialized params vary
+_RPC_ENVELOPE = b'{"jsonrpc":"2.0","id":%d,"method":"%s","params":%s}'
+
+# Opening offer as a share of budget (balanced/llm use initial_offer_pct)
+_OPENING_PCT = {"firm": 0.5, "flexible": 0.75}
+
+# Concession-curve risk tolerance per strategy
+_STRATEGY_RISK = {"firm": 0.3, "flexible": 0.85}
+
+# Default headers on the shared client, so requests don't carry their own
+_JSON_HEADERS = {"content-type": "application/json", "accept": "application/json"}
+
+# First JSON object in an LLM reply (allows one level of nesting)
+_JSON_RE = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}")
+
+# LRU of LLM decisions keyed by negotiation state: offers as 1% buckets of the
+# budget, round, and buyer config. Shared by every buyer in the process, so a
+# situation one buyer paid an LLM call for is free for the next.
+_LLM_DECISIONS: "OrderedDict[tuple, dict]" = OrderedDict()
+_LLM_DECISIONS_MAX = 1024
+
+# Example buyer lines per round for the LLM prompt ({suggested} = suggested counter)
+_DIALOGUE_STYLES = {
+    1: (
+        "That's higher than I expected for this scope. Would {suggested} work?",
+        "Interesting. I was thinking more like {suggested} - can we meet there?",
+        "I see - but {suggested} is closer to what I had budgeted. Thoughts?",
+    ),
+    2: (
+        "I appreciate you explaining. How about {suggested}?",
+        "That helps, but I can only go up to {suggested} right now.",
+        "Let me come up a bit to {suggested}. Can you work with that?",
+    ),
+    3: (
+        "We're getting closer. I can do {suggested} - meet me there?",
+        "I'm trying to make this work. {suggested} is my best offer.",
+        "Splitting the difference at {suggested}?",
+    ),
+    4: (
+        "{suggested} is really my max. Can we shake on it?",
+        "Final push - {suggested}. That's all I've got.",
+        "I want this to work. {suggested} - deal?",
+    ),
+    5: (
+        "Alright, you've convinced me. Let's do it.",
+        "Deal. I can work with that.",
+        "Fine, that's fair. Let's move forward.",
+    ),
+}
+
+# LLM buyer prompt. The system part is filled once per buyer (Buyer._system_prompt)
+# and stays byte-identical across rounds so providers can cache the prefix;
+# everything that changes per round goes in the user message.
+_LLM_SYSTEM_TEMPLATE = """You are buying a service. Negotiate smartly with varied responses.
+
+YOUR POSITION:
+- Budget: {budget} (max)
+
+{instructions}
+
+RULES:
+1. Never counter below the suggested price for the round (you're going UP)
+2. Vary your dialogue - don't repeat "that's a bit high" every time
+3. Be conversational, not robotic
+
+Respond with ONLY JSON:
+{{"action": "counter", "price": <your price>, "reason": "Your unique response"}}
+{{"action": "accept", "reason": "Brief acceptance"}}
+
+JSON ONLY:"""
+
+_LLM_ROUND_TEMPLATE = """Seller wants {seller_offer}. Round {round_num}/{max_rounds}.
+
+- Your last offer: {my_offer}
+- Seller asking: {seller_offer}
+
+{round_guidance}
+
+Your counter must be {suggested} or higher.
+Example for this round: "{example_style}"
+
+Suggested JSON:
+{{"action": "counter", "price": {suggested_price}, "reason": "Your unique response"}}"""
+
+_ROUND_GUIDANCE_PUSH_BACK = """ROUND {round_num} - PUSH BACK:
+- Counter at {suggested} (don't accept yet!)
+- Question their pricing, ask for justification
+- Be friendly but firm"""
+
+_ROUND_GUIDANCE_NEGOTIATE = """ROUND {round_num} - NEGOTIATE:
+- Counter at {suggested}
+- Show you're serious about making a deal
+- Move toward middle ground"""
+
+_ROUND_GUIDANCE_FINAL = """ROUND {round_num} (FINAL):
+- Accept if their price is reasonable (within budget)
+- Or make final counter at {suggested}
+- This is your last chance"""
+
+# Fixed part of every offer the buyer sends
+_OFFER_TERMS = {"currency": "USDC", "network": "base"}
+
+# How long a seller's discover result is reused before asking again
+_DISCOVER_TTL_S = 300.0
+
+# Seller lost the job's cached input (e.g. restarted) and wants it resent
+_INPUT_REQUIRED = -32020
+
+# The request never reached the seller - safe to resend any method
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Might have been processed - only resend read-only methods
+_TRANSIENT_ERRORS = (httpx.TransportError,)
+_IDEMPOTENT_METHODS = frozenset({"apex/discover", "apex/estimate"})
+_RETRY_BASE_DELAY = 0.25
+_RETRY_MAX_DELAY = 5.0
+# Statuses a read-only call is retried on
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Backoff before retry number attempt + 1, honoring a seller's Retry-After (in seconds)."""
+    if response is not None:
+        try:
+            return min(float(response.headers["retry-after"]), _RETRY_MAX_DELAY)
+        except (KeyError, ValueError):
+            pass
+    return min(_RETRY_BASE_DELAY * (2 ** attempt), _RETRY_MAX_DELAY) + random.random() * _RETRY_BASE_DELAY
+
+
+def _background(coro) -> asyncio.Task:
+    """Start coro as a task whose failure is ignored if nobody awaits it."""
+    task = asyncio.create_task(coro)
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
+class _Transcript:
+    """Verbose output of one call(), buffered and written to stdout once per round
+    (or once per call in batch mode, so concurrent calls don't interleave)."""
+    
+    __slots__ = ("_buf", "_typewriter", "_batch")
+    
+    def __init__(self, typewriter: bool = False, batch: bool = False):
+        self._buf = io.StringIO()
+        self._typewriter = typewriter
+        self._batch = batch
+    
+    def line(self, text: str):
+        self._buf.write(text)
+        self._buf.write("\n")
+    
+    async def say(self, text: str):
+        """An indented line of dialogue, typed out in typewriter mode."""
+        if self._typewriter:
+            self.flush()
+            sys.stdout.write("   ")
+            await _atype_text(text)
+        else:
+            self.line("   " + text)
+    
+    def end_round(self):
+        if not self._batch:
+            self.flush()
+    
+    def flush(self):
+        data = self._buf.getvalue()
+        if data:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+            self._buf.seek(0)
+            self._buf.truncate()
+
+
+class _History:
+    """Negotiation history as parallel C arrays; dicts are built once, for the result."""
+    
+    __slots__ = ("party", "amount", "round")
+    
+    _PARTIES = ("buyer", "seller")
+    
+    def __init__(self):
+        self.party = array.array("b")  # index into _PARTIES
+        self.amount = array.array("d")
+        self.round = array.array("H")
+    
+    def add(self, party: int, amount: float, round_num: int):
+        self.party.append(party)
+        self.amount.append(amount)
+        self.round.append(round_num)
+    
+    def to_list(self) -> list[dict]:
+        parties = self._PARTIES
+        return [
+            {"party": parties[p], "amount": a, "round": r}
+            for p, a, r in zip(self.party, self.amount, self.round)
+        ]
+
+
+_BUYER, _SELLER = 0, 1
+
+
+def _buyer_client() -> httpx.AsyncClient:
+    """Pooled client shared by all buyers on an event loop.
+    
+    With h2 installed, rounds to the same https seller multiplex over one HTTP/2
+    connection (negotiated via ALPN; HTTP/1.1 servers and http:// URLs are unaffected).
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2,
+        # Reads cover seller-side LLM work; everything else should be quick
+        timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=100, keepalive_expiry=30.0),
+        headers=_JSON_HEADERS,
+    )
 
 
 @dataclass
@@ -82,6 +322,23 @@ class NegotiationResult:
     tx_hash: Optional[str] = None
     explorer_url: Optional[str] = None
     payment_verified: bool = False
+    payment_task: Optional["asyncio.Task"] = field(default=None, repr=False)  # payment_mode="async"
+    
+    async def await_payment(self) -> "NegotiationResult":
+        """Wait for a background payment (payment_mode="async") and fill in the payment fields."""
+        if self.payment_task is not None:
+            payment = await self.payment_task
+            self.payment_task = None
+            self._apply_payment(payment)
+        return self
+    
+    def _apply_payment(self, payment: dict):
+        """Copy a successful payment into the result."""
+        if payment.get("success"):
+            self.tx_hash = payment.get("tx_hash")
+            self.explorer_url = payment.get("explorer_url")
+            # Broadcast but not yet mined (payment_mode="nowait" or receipt timeout)
+            self.payment_verified = payment.get("confirmed", True)
 
 
 @dataclass 
@@ -96,15 +353,39 @@ class Buyer:
     wallet: Optional["Wallet"] = None  # Real wallet for payments
     auto_pay: bool = False  # Auto-pay on successful negotiation
     mock_wallet: Optional[str] = None  # Mock wallet address (for testing)
+    cache_llm: bool = True  # Reuse LLM decisions for equivalent negotiation states (offers within 1% of budget)
+    max_retries: int = 3  # Retries per JSON-RPC call on transient network errors / 5xx
+    llm_skip_heuristics: bool = True  # Decide obvious rounds without calling the LLM
+    typing_effect: bool = False  # Type out verbose dialogue (same as verbose="typewriter")
+    own_client: bool = False  # Private connection pool, closed on exit (default: shared per event loop)
     
     # Internal
     _http: Optional[httpx.AsyncClient] = None
-    _llm_client: object = None
+    _seller_cache: Optional[dict] = None  # url -> (expires_at, discover result)
+    _initial_offer_cents: int = 0
+    _budget_cents: int = 0
+    _risk: float = 0.6
+    _instructions_text: str = ""
+    _system_prompt: str = ""
     
     def __post_init__(self):
         # Generate mock wallet if no real wallet and no mock specified
         if self.wallet is None and self.mock_wallet is None:
-            self.mock_wallet = "0x" + uuid.uuid4().hex[:40]
+            self.mock_wallet = "0x" + secrets.token_hex(20)
+        
+        self._seller_cache = {}
+        
+        # Strategy constants, resolved once instead of per round.
+        # Offer arithmetic runs in integer cents; floats only at the JSON boundary.
+        self._budget_cents = round(self.budget * 100)
+        pct = _OPENING_PCT.get(self.strategy, self.initial_offer_pct)
+        self._initial_offer_cents = round(self._budget_cents * pct)
+        self._risk = _STRATEGY_RISK.get(self.strategy, 0.6)
+        self._instructions_text = self._format_instructions()
+        self._system_prompt = _LLM_SYSTEM_TEMPLATE.format(
+            budget=f"${self.budget:.2f}",
+            instructions=self._instructions_text,
+        )
     
     @property
     def address(self) -> str:
@@ -114,12 +395,17 @@ class Buyer:
         return self.mock_wallet
     
     async def __aenter__(self):
-        self._http = httpx.AsyncClient(timeout=60.0)
+        if self.own_client:
+            self._http = _buyer_client()
+        else:
+            # Shared across buyers on this event loop; closed by apex.shutdown()
+            self._http = get_client("buyer", _buyer_client)
         return self
     
     async def __aexit__(self, *args):
-        if self._http:
+        if self.own_client and self._http is not None:
             await self._http.aclose()
+        self._http = None
     
     async def balance(self) -> Optional[float]:
         """Get USDC balance (if real wallet)."""
@@ -133,7 +419,8 @@ class Buyer:
         capability: str,
         input: dict,
         max_rounds: int = 5,
-        verbose: bool = False,
+        verbose: Union[bool, Literal["typewriter", "batch"]] = False,
+        payment_mode: Literal["sync", "async", "nowait"] = "sync",
     ) -> NegotiationResult:
         """Call an agent and auto-negotiate (optionally auto-pay).
         
@@ -142,26 +429,101 @@ class Buyer:
             capability: Capability to invoke
             input: Input data for the capability
             max_rounds: Maximum negotiation rounds
-            verbose: Print negotiation progress with typing effect
+            verbose: Print negotiation progress (True), "typewriter" to
+                type out dialogue character by character, or "batch" to print
+                the whole transcript when the call ends (for concurrent calls)
+            payment_mode: How auto-pay settles once a price is agreed:
+                "sync" waits for the transfer to be mined (default),
+                "nowait" returns once it is broadcast (payment_verified=False),
+                "async" pays in the background - see result.await_payment()
         
         Returns:
             NegotiationResult with success status, output, and payment info
         """
-        history = []
-        job_id = str(uuid.uuid4())
-        self._last_reason = None  # Track buyer's reasoning for display
+        out = _Transcript(verbose == "typewriter" or self.typing_effect, verbose == "batch") if verbose else None
+        try:
+            return await self._call(url, capability, input, max_rounds, verbose, payment_mode, out)
+        finally:
+            if out is not None:
+                out.flush()
+    
+    async def call_many(
+        self,
+        requests: list[tuple[str, str, dict]],
+        concurrency: int = 16,
+        max_rounds: int = 5,
+        payment_mode: Literal["sync", "async", "nowait"] = "sync",
+    ) -> list[NegotiationResult]:
+        """Negotiate with several sellers concurrently.
+        
+        Args:
+            requests: (url, capability, input) per seller
+            concurrency: Maximum negotiations in flight at once
+            max_rounds: Maximum negotiation rounds per seller
+            payment_mode: See call()
+        
+        Returns:
+            One NegotiationResult per request, in the same order. A call that
+            raised comes back as success=False with the exception as error.
+        
+        Each negotiation works against the full budget independently; with
+        auto_pay, every successful deal is paid.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def one(url: str, capability: str, input: dict) -> NegotiationResult:
+            async with semaphore:
+                return await self.call(url, capability, input, max_rounds=max_rounds, payment_mode=payment_mode)
+        
+        results = await asyncio.gather(
+            *(one(url, capability, input) for url, capability, input in requests),
+            return_exceptions=True,
+        )
+        return [
+            r if isinstance(r, NegotiationResult) else NegotiationResult(success=False, error=str(r) or type(r).__name__)
+            for r in results
+        ]
+    
+    async def _call(
+        self,
+        url: str,
+        capability: str,
+        input: dict,
+        max_rounds: int,
+        verbose: Union[bool, str],
+        payment_mode: str,
+        out: Optional["_Transcript"],
+    ) -> NegotiationResult:
+        """call() body; verbose output goes to `out`, written once per round."""
+        history = _History()
+        if self.wallet is None:
+            # Mock flows: per-process random prefix + counter, no RNG read per call
+            job_id = f"{_MOCK_JOB_PREFIX}-{next(_MOCK_JOB_SEQ)}"
+        else:
+            job_id = secrets.token_hex(16)  # 128 random bits, as collision-resistant as UUIDv4
+        last_reason = None  # Track buyer's reasoning for display (local: calls may run concurrently)
         
         # Track estimate info
         estimate_info = None
         estimate_id = None
         
-        # Get seller info (for payment address and pricing model)
-        seller_info = await self._discover(url)
+        # Prefetched chain reads for auto-pay (see Wallet.prepare_transfer)
+        prep_task = None
+        
+        # Get seller info (for payment address and pricing model). For a seller
+        # we haven't discovered yet, request the estimate speculatively alongside
+        # discovery so both round trips overlap; it's cancelled if not needed.
+        estimate_task = None
+        if self._cached_seller_info(url) is None:
+            estimate_task = asyncio.create_task(self._estimate(url, capability, input))
+        seller_info = await self._get_seller_info(url)
         seller_address = None
         requires_estimation = False
+        send_input = True  # resend input on every round unless the seller caches it
         
         if seller_info:
             seller_address = seller_info.get("payment", {}).get("address")
+            send_input = not seller_info.get("features", {}).get("job_cache")
             # Check if estimation is required
             capabilities = seller_info.get("capabilities", [])
             for cap in capabilities:
@@ -170,9 +532,15 @@ class Buyer:
                     requires_estimation = True
                     break
         
+        if estimate_task is not None and not requires_estimation:
+            estimate_task.cancel()
+        
         # Step 1: Get estimate if needed
         if requires_estimation:
-            estimate_result = await self._estimate(url, capability, input)
+            if estimate_task is not None:
+                estimate_result = await estimate_task
+            else:
+                estimate_result = await self._estimate(url, capability, input)
             
             if estimate_result and estimate_result.get("status") == "estimated":
                 estimate_info = estimate_result.get("estimate", {})
@@ -188,7 +556,7 @@ class Buyer:
                 floor_price = negotiation.get("floor", estimate_info.get("low", 0))
                 if floor_price > self.budget:
                     if verbose:
-                        print(f"\n{_C.RED}❌ Budget insufficient: need at least ${floor_price:.2f}, have ${self.budget:.2f}{_C.RESET}")
+                        out.line(f"\n{_C.RED}❌ Budget insufficient: need at least ${floor_price:.2f}, have ${self.budget:.2f}{_C.RESET}")
                     return NegotiationResult(
                         success=False,
                         rounds=0,
@@ -209,37 +577,41 @@ class Buyer:
         
         if verbose:
             if requires_estimation:
-                print(f"\n{_C.YELLOW}💬 NEGOTIATION{_C.RESET}")
+                out.line(f"\n{_C.YELLOW}💬 NEGOTIATION{_C.RESET}")
         
         for round_num in range(1, max_rounds + 1):
             if verbose:
-                print(f"\n{_C.YELLOW}▸ Round {round_num}/{max_rounds}{_C.RESET}")
+                out.end_round()  # previous round
+                out.line(f"\n{_C.YELLOW}▸ Round {round_num}/{max_rounds}{_C.RESET}")
             
             # Show buyer's offer
             if verbose:
-                print(f"\n{_C.BUYER}🛒 BUYER{_C.RESET} {_C.DIM}[offers ${offer:.2f}]{_C.RESET}")
+                out.line(f"\n{_C.BUYER}🛒 BUYER{_C.RESET} {_C.DIM}[offers ${offer:.2f}]{_C.RESET}")
                 if round_num == 1:
-                    sys.stdout.write(f"   ")
-                    _type_text(f'"I\'d like to use your services. Here\'s my opening offer."')
-                elif hasattr(self, '_last_reason') and self._last_reason:
-                    sys.stdout.write(f"   ")
-                    _type_text(f'"{self._last_reason}"')
+                    await out.say(f'"I\'d like to use your services. Here\'s my opening offer."')
+                elif last_reason:
+                    await out.say(f'"{last_reason}"')
+            
+            # From round 2 a deal is close: fetch balance/nonce/gas for the payment
+            # now so those chain reads overlap the remaining negotiation
+            if prep_task is None and round_num >= 2 and self.auto_pay and self.wallet and seller_address:
+                prep_task = _background(self.wallet.prepare_transfer())
             
             # Send offer (include estimate_id if we have one)
             if round_num == 1:
                 result = await self._propose(url, capability, input, offer, job_id, estimate_id)
             else:
-                result = await self._counter(url, job_id, offer, round_num, input)
+                result = await self._counter(url, job_id, offer, round_num, input, send_input)
             
-            history.append({"party": "buyer", "amount": offer, "round": round_num})
+            history.add(_BUYER, offer, round_num)
             
             if "error" in result:
                 if verbose:
-                    print(f"{_C.RED}❌ {result['error'].get('message', 'Error')}{_C.RESET}")
+                    out.line(f"{_C.RED}❌ {result['error'].get('message', 'Error')}{_C.RESET}")
                 return NegotiationResult(
                     success=False,
                     rounds=round_num,
-                    history=history,
+                    history=history.to_list(),
                     error=result["error"].get("message", "Unknown error"),
                     estimate=estimate_info,
                     estimate_id=estimate_id,
@@ -253,120 +625,91 @@ class Buyer:
                 final_price = final["terms"]["amount"]
                 
                 if verbose:
-                    print(f"\n{_C.GREEN}✅ Seller accepted ${final_price:.2f}{_C.RESET}")
+                    out.line(f"\n{_C.GREEN}✅ Seller accepted ${final_price:.2f}{_C.RESET}")
                     
                     # Show estimate comparison if we had one
                     if estimate_info:
                         est_amount = estimate_info.get("amount", 0)
                         if est_amount > 0:
                             pct = (final_price / est_amount) * 100
-                            print(f"   {_C.DIM}Settled at {pct:.0f}% of estimate (${est_amount:.2f}){_C.RESET}")
-                
-                # Handle payment if auto_pay enabled
-                tx_hash = None
-                explorer_url = None
-                payment_verified = False
-                
-                if self.auto_pay and self.wallet and seller_address:
-                    payment_result = await self._make_payment(
-                        seller_address=seller_address,
-                        amount=final_price,
-                        job_id=job_id,
-                    )
-                    
-                    if payment_result.get("success"):
-                        tx_hash = payment_result.get("tx_hash")
-                        explorer_url = payment_result.get("explorer_url")
-                        payment_verified = True
+                            out.line(f"   {_C.DIM}Settled at {pct:.0f}% of estimate (${est_amount:.2f}){_C.RESET}")
                 
-                return NegotiationResult(
+                result = NegotiationResult(
                     success=True,
                     final_price=final_price,
                     output=final.get("output"),
                     rounds=round_num,
-                    history=history,
+                    history=history.to_list(),
                     estimate=estimate_info,
                     estimate_id=estimate_id,
-                    tx_hash=tx_hash,
-                    explorer_url=explorer_url,
-                    payment_verified=payment_verified,
                 )
+                
+                # Handle payment if auto_pay enabled
+                await self._settle(result, seller_address, final_price, job_id, payment_mode, prep_task)
+                return result
             
             # Seller countered
             elif status == "counter":
                 seller_offer = result["result"]["offer"]["amount"]
                 reason = result["result"].get("reason")
-                history.append({"party": "seller", "amount": seller_offer, "round": round_num})
+                history.add(_SELLER, seller_offer, round_num)
                 
                 if verbose:
-                    print(f"\n{_C.SELLER}🤖 SELLER{_C.RESET} {_C.DIM}[${seller_offer:.2f}]{_C.RESET}")
+                    out.line(f"\n{_C.SELLER}🤖 SELLER{_C.RESET} {_C.DIM}[${seller_offer:.2f}]{_C.RESET}")
                     if reason:
-                        sys.stdout.write(f"   ")
-                        _type_text(f'"{reason}"')
+                        await out.say(f'"{reason}"')
                 
                 # Decide response
-                decision = await self._decide(offer, seller_offer, round_num, max_rounds)
+                if self.strategy == "llm" and self.model:
+                    decision = await self._decide_llm(offer, seller_offer, round_num, max_rounds)
+                else:
+                    decision = self._decide(offer, seller_offer, round_num, max_rounds)
                 
                 if decision["action"] == "accept":
                     # Accept seller's price
                     if verbose:
-                        print(f"\n{_C.BUYER}🛒 BUYER{_C.RESET} {_C.DIM}[accepts ${seller_offer:.2f}]{_C.RESET}")
+                        out.line(f"\n{_C.BUYER}🛒 BUYER{_C.RESET} {_C.DIM}[accepts ${seller_offer:.2f}]{_C.RESET}")
                         accept_reason = decision.get("reason", "That works for me. Deal!")
-                        sys.stdout.write(f"   ")
-                        _type_text(f'"{accept_reason}"')
-                    
-                    result = await self._accept(url, job_id, seller_offer, input)
-                    
-                    # Handle payment
-                    tx_hash = None
-                    explorer_url = None
-                    payment_verified = False
-                    
-                    if self.auto_pay and self.wallet and seller_address:
-                        payment_result = await self._make_payment(
-                            seller_address=seller_address,
-                            amount=seller_offer,
-                            job_id=job_id,
-                        )
-                        
-                        if payment_result.get("success"):
-                            tx_hash = payment_result.get("tx_hash")
-                            explorer_url = payment_result.get("explorer_url")
-                            payment_verified = True
+                        await out.say(f'"{accept_reason}"')
                     
-                    if verbose and estimate_info:
-                        est_amount = estimate_info.get("amount", 0)
-                        if est_amount > 0:
-                            pct = (seller_offer / est_amount) * 100
-                            print(f"\n   {_C.DIM}Settled at {pct:.0f}% of estimate (${est_amount:.2f}){_C.RESET}")
+                    if prep_task is None and self.auto_pay and self.wallet and seller_address:
+                        prep_task = _background(self.wallet.prepare_transfer())
+                    result = await self._accept(url, job_id, seller_offer, input, send_input)
                     
-                    return NegotiationResult(
+                    final = NegotiationResult(
                         success=True,
                         final_price=seller_offer,
                         output=result.get("result", {}).get("output"),
                         rounds=round_num,
-                        history=history,
+                        history=history.to_list(),
                         estimate=estimate_info,
                         estimate_id=estimate_id,
-                        tx_hash=tx_hash,
-                        explorer_url=explorer_url,
-                        payment_verified=payment_verified,
                     )
+                    
+                    # Handle payment
+                    await self._settle(final, seller_address, seller_offer, job_id, payment_mode, prep_task)
+                    
+                    if verbose and estimate_info:
+                        est_amount = estimate_info.get("amount", 0)
+                        if est_amount > 0:
+                            pct = (seller_offer / est_amount) * 100
+                            out.line(f"\n   {_C.DIM}Settled at {pct:.0f}% of estimate (${est_amount:.2f}){_C.RESET}")
+                    
+                    return final
                 
                 elif decision["action"] == "counter":
                     offer = decision["price"]
-                    self._last_reason = decision.get("reason", "Let me counter with this offer.")
+                    last_reason = decision.get("reason", "Let me counter with this offer.")
                 
                 else:  # reject
                     if verbose:
                         reason = decision.get("reason", "Price too high")
-                        print(f"\n{_C.BUYER}🛒 BUYER{_C.RESET} {_C.DIM}[walks away]{_C.RESET}")
-                        sys.stdout.write(f"   ")
-                        _type_text(f'"{reason}"')
+                        out.line(f"\n{_C.BUYER}🛒 BUYER{_C.RESET} {_C.DIM}[walks away]{_C.RESET}")
+                        await out.say(f'"{reason}"')
                     return NegotiationResult(
                         success=False,
                         rounds=round_num,
-                        history=history,
+                        history=history.to_list(),
                         error=decision.get("reason", "Buyer rejected - price too high"),
                         estimate=estimate_info,
                         estimate_id=estimate_id,
@@ -375,19 +718,57 @@ class Buyer:
         return NegotiationResult(
             success=False,
             rounds=max_rounds,
-            history=history,
+            history=history.to_list(),
             error="Max rounds exceeded",
             estimate=estimate_info,
             estimate_id=estimate_id,
         )
     
+    async def _settle(
+        self,
+        result: NegotiationResult,
+        seller_address: Optional[str],
+        amount: float,
+        job_id: str,
+        payment_mode: str,
+        prep_task: Optional[asyncio.Task] = None,
+    ):
+        """Auto-pay for a completed negotiation according to payment_mode."""
+        if not (self.auto_pay and self.wallet and seller_address):
+            return
+        
+        if payment_mode == "async":
+            result.payment_task = asyncio.create_task(self._make_payment(
+                seller_address=seller_address, amount=amount, job_id=job_id, prep_task=prep_task,
+            ))
+            return
+        
+        wait = payment_mode != "nowait"
+        payment = await self._make_payment(
+            seller_address=seller_address,
+            amount=amount,
+            job_id=job_id,
+            wait_for_receipt=wait,
+            prep_task=prep_task,
+        )
+        result._apply_payment(payment)
+    
     async def _make_payment(
         self,
         seller_address: str,
         amount: float,
         job_id: str,
+        wait_for_receipt: bool = True,
+        prep_task: Optional[asyncio.Task] = None,
     ) -> dict:
-        """Make payment via real wallet."""
+        """Make payment via real wallet (using prefetched chain reads if prep_task succeeded)."""
+        prepared = None
+        if prep_task is not None:
+            try:
+                prepared = await prep_task
+            except Exception:
+                pass  # transfer fetches them itself
+        
         try:
             from .payments import Payment
             
@@ -398,13 +779,14 @@ class Buyer:
                 seller_address=seller_address,
             )
             
-            result = await payment.execute()
+            result = await payment.execute(wait_for_receipt=wait_for_receipt, prepared=prepared)
             
             return {
                 "success": result.success,
                 "tx_hash": result.tx_hash,
                 "explorer_url": result.explorer_url,
                 "error": result.error,
+                "confirmed": result.confirmed,
             }
         except Exception as e:
             return {
@@ -412,106 +794,133 @@ class Buyer:
                 "error": str(e),
             }
     
+    async def _get_seller_info(self, url: str) -> Optional[dict]:
+        """Discover seller info, reusing the result from earlier calls to the same URL."""
+        seller_info = self._cached_seller_info(url)
+        if seller_info is None:
+            seller_info = await self._discover(url)
+            if seller_info:
+                self._seller_cache[url] = (time.monotonic() + _DISCOVER_TTL_S, seller_info)
+        return seller_info
+    
+    def _cached_seller_info(self, url: str) -> Optional[dict]:
+        """Cached discover result for url, or None if missing or expired."""
+        entry = self._seller_cache.get(url)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._seller_cache[url]
+            return None
+        return entry[1]
+    
     async def _discover(self, url: str) -> Optional[dict]:
         """Discover agent info (for payment address and pricing)."""
-        try:
-            response = await self._http.post(url, json={
-                "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
-                "method": "apex/discover",
-                "params": {},
-            })
-            result = response.json()
-            return result.get("result")
-        except Exception:
-            return None
+        return await self._rpc_result(url, "apex/discover", {})
     
     async def _estimate(self, url: str, capability: str, input: dict) -> Optional[dict]:
         """Request estimate from agent."""
-        try:
-            response = await self._http.post(url, json={
-                "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
-                "method": "apex/estimate",
-                "params": {
-                    "capability": capability,
-                    "input": input,
-                },
-            })
-            result = response.json()
-            return result.get("result")
-        except Exception:
-            return None
+        return await self._rpc_result(url, "apex/estimate", {"capability": capability, "input": input})
     
     def _calculate_initial_offer(self) -> float:
         """Calculate initial offer based on strategy (budget-based)."""
-        if self.strategy == "firm":
-            pct = 0.5  # Start low
-        elif self.strategy == "flexible":
-            pct = 0.75  # Start higher
-        else:  # balanced or llm
-            pct = 0.6
-        
-        return round(self.budget * pct, 2)
+        return self._initial_offer_cents / 100
     
     def _calculate_offer_from_estimate(self, estimate: dict) -> float:
         """Calculate initial offer based on estimate - start LOW to allow negotiation."""
-        amount = estimate.get("amount", 0)
-        low = estimate.get("minimum", estimate.get("low", amount * 0.8))
+        amount_c = round(estimate.get("amount", 0) * 100)
+        low = estimate.get("minimum", estimate.get("low"))
+        low_c = round(low * 100) if low is not None else amount_c * 4 // 5
+        budget_c = self._budget_cents
         
         # Start at 50-70% of estimate to leave room for negotiation
         if self.strategy == "firm":
             # Start very low - 50% of estimate
-            offer = amount * 0.5
+            offer_c = amount_c * 50 // 100
         elif self.strategy == "flexible":
             # Start at 70% of estimate  
-            offer = amount * 0.7
+            offer_c = amount_c * 70 // 100
         else:  # balanced or llm
             # Start at 55-60% of estimate
-            offer = amount * 0.55
+            offer_c = amount_c * 55 // 100
         
         # Never go below seller's minimum (pointless)
-        offer = max(offer, low * 0.9)
+        offer_c = max(offer_c, low_c * 90 // 100)
         
         # Cap at budget
-        if offer > self.budget:
-            offer = self.budget * 0.6
+        if offer_c > budget_c:
+            offer_c = budget_c * 60 // 100
         
-        return round(min(offer, self.budget), 2)
+        return min(offer_c, budget_c) / 100
     
-    async def _decide(
+    async def _decide_llm(
         self,
         my_offer: float,
         seller_offer: float,
         round_num: int,
         max_rounds: int,
     ) -> dict:
-        """Decide how to respond to seller's counter."""
-        
-        # For LLM strategy, let the LLM decide (don't auto-accept)
-        if self.strategy == "llm" and self.model:
-            return await self._llm_decide(my_offer, seller_offer, round_num, max_rounds)
+        """Decide how to respond to seller's counter with the LLM (don't auto-accept)."""
+        if self.llm_skip_heuristics:
+            decision = self._obvious_decision(
+                round(my_offer * 100), round(seller_offer * 100), round_num, max_rounds
+            )
+            if decision is not None:
+                return decision
+        return await self._llm_decide(my_offer, seller_offer, round_num, max_rounds)
+    
+    def _decide(
+        self,
+        my_offer: float,
+        seller_offer: float,
+        round_num: int,
+        max_rounds: int,
+    ) -> dict:
+        """Decide how to respond to seller's counter (algorithmic strategies, no I/O)."""
+        my_c = round(my_offer * 100)
+        sel_c = round(seller_offer * 100)
+        within_budget = sel_c <= self._budget_cents
         
         # Accept if within budget (for non-LLM strategies)
-        if seller_offer <= self.budget:
+        if within_budget:
             if self.strategy == "flexible":
                 return {"action": "accept", "reason": "That works for me. Deal!"}
             elif self.strategy == "firm":
-                if seller_offer <= my_offer * 1.1:
+                # seller <= my * 1.1
+                if sel_c * 10 <= my_c * 11:
                     return {"action": "accept"}
             else:  # balanced
-                midpoint = (my_offer + seller_offer) / 2
-                if seller_offer <= midpoint * 1.1:
+                # seller <= midpoint * 1.1
+                if sel_c * 20 <= (my_c + sel_c) * 11:
                     return {"action": "accept"}
         
         # Last round and over budget - reject
-        if round_num >= max_rounds and seller_offer > self.budget:
+        if round_num >= max_rounds and not within_budget:
             return {"action": "reject", "reason": "Exceeds my budget, can't go higher."}
         
         # Algorithmic fallback
-        new_offer = self._curve_counter(my_offer, seller_offer, round_num, max_rounds)
+        new_offer = self._curve_counter_cents(my_c, sel_c, round_num, max_rounds) / 100
         return {"action": "counter", "price": new_offer}
     
+    def _obvious_decision(self, my_c: int, sel_c: int, round_num: int, max_rounds: int) -> Optional[dict]:
+        """Decision for rounds with only one sensible answer (offers in cents), else None."""
+        budget_c = self._budget_cents
+        
+        # Seller already matched or beat our offer
+        if sel_c <= my_c:
+            return {"action": "accept", "reason": "That works for me. Deal!"}
+        
+        # No room left to move up
+        if my_c >= budget_c:
+            if round_num >= max_rounds:
+                return {"action": "reject", "reason": "Exceeds my budget, can't go higher."}
+            return {"action": "counter", "price": budget_c / 100, "reason": "That's my budget - I can't go any higher."}
+        
+        # Opening ask is far outside budget (> 1.5x)
+        if round_num == 1 and sel_c * 2 > budget_c * 3:
+            return {"action": "reject", "reason": "That's well beyond my budget. I'll pass."}
+        
+        return None
+    
     def _curve_counter(
         self,
         my_offer: float,
@@ -519,25 +928,26 @@ class Buyer:
         round_num: int,
         max_rounds: int,
     ) -> float:
-        """Calculate counter using exponential concession curve."""
+        """Calculate counter using exponential concession curve.
         
-        # Risk tolerance based on strategy
-        if self.strategy == "firm":
-            risk = 0.3
-        elif self.strategy == "flexible":
-            risk = 0.85
-        else:
-            risk = 0.6
+        Batch simulations can use apex._curve_numba.curve_counter_batch instead.
+        """
+        cents = self._curve_counter_cents(
+            round(my_offer * 100), round(seller_offer * 100), round_num, max_rounds
+        )
+        return cents / 100
+    
+    def _curve_counter_cents(self, my_c: int, sel_c: int, round_num: int, max_rounds: int) -> int:
+        """_curve_counter in integer cents."""
         
         # How much room we have
-        room = min(self.budget, seller_offer) - my_offer
+        room = min(self._budget_cents, sel_c) - my_c
         
         # Exponential concession
         progress = round_num / max_rounds
-        concession = room * (1 - math.exp(-risk * progress * 3))
+        concession = round(room * -math.expm1(-self._risk * progress * 3))
         
-        new_offer = my_offer + concession
-        return round(min(new_offer, self.budget), 2)
+        return min(my_c + concession, self._budget_cents)
     
     async def _llm_decide(
         self,
@@ -547,115 +957,79 @@ class Buyer:
         max_rounds: int,
     ) -> dict:
         """Use LLM to decide response with reasoning."""
+        cache_key = None
+        if self.cache_llm and self.budget > 0:
+            cache_key = (
+                self.strategy, round_num, max_rounds,
+                round(my_offer / self.budget, 2), round(seller_offer / self.budget, 2),
+                self.model, tuple(self.instructions),
+            )
+            cached = _LLM_DECISIONS.get(cache_key)
+            if cached is not None:
+                _LLM_DECISIONS.move_to_end(cache_key)
+                return self._rescale_decision(cached)
+        
         _load_env()
         
-        # Calculate reasonable next offer - move up gradually
-        gap = seller_offer - my_offer
+        # Calculate reasonable next offer - move up gradually (in cents)
+        my_c = round(my_offer * 100)
+        gap_c = round(seller_offer * 100) - my_c
         if round_num <= 2:
-            concession = gap * 0.25  # Small steps early
+            concession_c = gap_c * 25 // 100  # Small steps early
         elif round_num <= 3:
-            concession = gap * 0.40
+            concession_c = gap_c * 40 // 100
         elif round_num <= 4:
-            concession = gap * 0.55
+            concession_c = gap_c * 55 // 100
         else:
-            concession = gap * 0.75  # Big step to close
-        
-        suggested_offer = round(min(my_offer + concession, self.budget), 2)
+            concession_c = gap_c * 75 // 100  # Big step to close
         
-        # Track if we're at last offer (for accept logic)
-        at_budget = suggested_offer >= self.budget * 0.95
+        suggested_offer = min(my_c + concession_c, self._budget_cents) / 100
         
         # Format prices
-        budget_str = f"${self.budget:.2f}"
         my_offer_str = f"${my_offer:.2f}"
         seller_offer_str = f"${seller_offer:.2f}"
         suggested_str = f"${suggested_offer:.2f}"
         
-        # Varied dialogue styles per round
-        import random
-        
-        dialogue_styles = {
-            1: [
-                f"That's higher than I expected for this scope. Would {suggested_str} work?",
-                f"Interesting. I was thinking more like {suggested_str} - can we meet there?",
-                f"I see - but {suggested_str} is closer to what I had budgeted. Thoughts?",
-            ],
-            2: [
-                f"I appreciate you explaining. How about {suggested_str}?",
-                f"That helps, but I can only go up to {suggested_str} right now.",
-                f"Let me come up a bit to {suggested_str}. Can you work with that?",
-            ],
-            3: [
-                f"We're getting closer. I can do {suggested_str} - meet me there?",
-                f"I'm trying to make this work. {suggested_str} is my best offer.",
-                f"Splitting the difference at {suggested_str}?",
-            ],
-            4: [
-                f"{suggested_str} is really my max. Can we shake on it?",
-                f"Final push - {suggested_str}. That's all I've got.",
-                f"I want this to work. {suggested_str} - deal?",
-            ],
-            5: [
-                "Alright, you've convinced me. Let's do it.",
-                "Deal. I can work with that.",
-                "Fine, that's fair. Let's move forward.",
-            ],
-        }
-        
-        style_options = dialogue_styles.get(round_num, dialogue_styles[5])
-        example_style = random.choice(style_options)
+        # Varied dialogue styles per round; only the chosen line gets formatted
+        style_options = _DIALOGUE_STYLES.get(round_num, _DIALOGUE_STYLES[5])
+        example_style = random.choice(style_options).format(suggested=suggested_str)
         
         # Round-specific guidance
         if round_num <= 2:
-            round_guidance = f"""ROUND {round_num} - PUSH BACK:
-- Counter at {suggested_str} (don't accept yet!)
-- Question their pricing, ask for justification
-- Be friendly but firm"""
+            guidance = _ROUND_GUIDANCE_PUSH_BACK
         elif round_num <= 4:
-            round_guidance = f"""ROUND {round_num} - NEGOTIATE:
-- Counter at {suggested_str}
-- Show you're serious about making a deal
-- Move toward middle ground"""
+            guidance = _ROUND_GUIDANCE_NEGOTIATE
         else:
-            round_guidance = f"""ROUND {round_num} (FINAL):
-- Accept if their price is reasonable (within budget)
-- Or make final counter at {suggested_str}
-- This is your last chance"""
-
-        system = f"""You are buying a service. Negotiate smartly with varied responses.
-
-YOUR POSITION:
-- Budget: {budget_str} (max)
-- Your last offer: {my_offer_str}  
-- Seller asking: {seller_offer_str}
-
-{round_guidance}
-
-{self._format_instructions()}
-
-RULES:
-1. Your counter must be {suggested_str} or higher (you're going UP)
-2. Vary your dialogue - don't repeat "that's a bit high" every time
-3. Be conversational, not robotic
-
-Example for this round: "{example_style}"
-
-Respond with ONLY JSON:
-{{"action": "counter", "price": {suggested_offer:.2f}, "reason": "Your unique response"}}
-{{"action": "accept", "reason": "Brief acceptance"}}
-
-JSON ONLY:"""
+            guidance = _ROUND_GUIDANCE_FINAL
+        round_guidance = guidance.format(round_num=round_num, suggested=suggested_str)
 
-        user = f"Seller wants {seller_offer_str}. Round {round_num}/{max_rounds}."
+        user = _LLM_ROUND_TEMPLATE.format(
+            round_num=round_num,
+            max_rounds=max_rounds,
+            my_offer=my_offer_str,
+            seller_offer=seller_offer_str,
+            round_guidance=round_guidance,
+            suggested=suggested_str,
+            suggested_price=f"{suggested_offer:.2f}",
+            example_style=example_style,
+        )
 
         try:
-            response = self._call_llm(system, user)
+            response = await self._call_llm(self._system_prompt, user)
             result = self._parse_llm_response(response)
             
             # Ensure price doesn't exceed budget
             if result.get("action") == "counter":
-                price = result.get("price", suggested_offer)
-                result["price"] = round(min(price, self.budget), 2)
+                price_c = round(result.get("price", suggested_offer) * 100)
+                result["price"] = min(price_c, self._budget_cents) / 100
+            
+            if cache_key is not None:
+                cached = dict(result)
+                if "price" in cached:
+                    cached["price_ratio"] = cached["price"] / self.budget
+                _LLM_DECISIONS[cache_key] = cached
+                if len(_LLM_DECISIONS) > _LLM_DECISIONS_MAX:
+                    _LLM_DECISIONS.popitem(last=False)
             
             return result
         except Exception:
@@ -665,22 +1039,32 @@ JSON ONLY:"""
                 "reason": example_style,
             }
     
+    def _rescale_decision(self, cached: dict) -> dict:
+        """Copy of a cached LLM decision with its counter price scaled to this budget."""
+        result = dict(cached)
+        ratio = result.pop("price_ratio", None)
+        if ratio is not None:
+            old_price = result["price"]
+            price = min(round(ratio * self._budget_cents), self._budget_cents) / 100
+            result["price"] = price
+            reason = result.get("reason")
+            if reason:
+                result["reason"] = reason.replace(f"${old_price:.2f}", f"${price:.2f}")
+        return result
+    
     def _format_instructions(self) -> str:
         if not self.instructions:
             return ""
         return "Instructions:\n" + "\n".join(f"- {i}" for i in self.instructions)
     
-    def _call_llm(self, system: str, user: str) -> str:
-        """Call LLM."""
+    async def _call_llm(self, system: str, user: str) -> str:
+        """Call LLM (async SDK clients, so the event loop keeps running)."""
         if "claude" in self.model.lower():
-            return self._call_anthropic(system, user)
-        return self._call_openai(system, user)
-    
-    def _call_openai(self, system: str, user: str) -> str:
-        from openai import OpenAI
-        if self._llm_client is None:
-            self._llm_client = OpenAI()
-        response = self._llm_client.chat.completions.create(
+            return await self._call_anthropic(system, user)
+        return await self._call_openai(system, user)
+    
+    async def _call_openai(self, system: str, user: str) -> str:
+        stream = await get_llm_client("openai").chat.completions.create(
             model=self.model,
             max_completion_tokens=100,
             temperature=0.9,
@@ -688,33 +1072,52 @@ JSON ONLY:"""
                 {"role": "system", "content": system},
                 {"role": "user", "content": user},
             ],
+            stream=True,
         )
-        return response.choices[0].message.content
+        # Stop reading as soon as the JSON reply is complete; skip trailing tokens
+        text = ""
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    text += delta
+                    if "}" in delta and _json.has_json_object(text):
+                        break
+        finally:
+            await stream.close()
+        return text
     
-    def _call_anthropic(self, system: str, user: str) -> str:
-        import anthropic
-        if self._llm_client is None:
-            self._llm_client = anthropic.Anthropic()
-        response = self._llm_client.messages.create(
+    async def _call_anthropic(self, system: str, user: str) -> str:
+        text = ""
+        async with get_llm_client("anthropic").messages.stream(
             model=self.model,
             max_tokens=100,
             temperature=0.9,
             system=system,
             messages=[{"role": "user", "content": user}],
-        )
-        return response.content[0].text
+        ) as stream:
+            async for delta in stream.text_stream:
+                text += delta
+                if "}" in delta and _json.has_json_object(text):
+                    break
+        return text
     
     def _parse_llm_response(self, text: str) -> dict:
-        import json
-        if "```" in text:
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-            text = text.strip()
-        if "{" in text:
-            json_str = text[text.index("{"):text.rindex("}") + 1]
-            return json.loads(json_str)
-        return {"action": "counter", "price": self.budget * 0.8, "reason": "Let's find middle ground."}
+        # Happy path: the model returned bare JSON as instructed
+        try:
+            data = _json.loads(text)
+        except _json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(data, dict):
+                return data
+        # Otherwise pull the object out of fences / surrounding prose
+        match = _JSON_RE.search(text)
+        if match:
+            return _json.loads(match.group(0))
+        return {"action": "counter", "price": self._budget_cents * 4 // 5 / 100, "reason": "Let's find middle ground."}
     
     async def _propose(
         self, 
@@ -725,52 +1128,88 @@ JSON ONLY:"""
         job_id: str,
         estimate_id: Optional[str] = None,
     ) -> dict:
-        params = {
+        return await self._rpc(url, "apex/propose", {
             "capability": capability,
             "input": input,
             "job_id": job_id,
-            "offer": {"amount": offer, "currency": "USDC", "network": "base"},
+            "offer": {"amount": offer, **_OFFER_TERMS},
             "buyer_address": self.address,
-        }
+            # Include estimate_id if we have one
+            **({"estimate_id": estimate_id} if estimate_id else {}),
+        })
+    
+    async def _counter(
+        self, url: str, job_id: str, offer: float, round_num: int, input: dict, send_input: bool = True
+    ) -> dict:
+        return await self._rpc_with_input(url, "apex/counter", {
+            "job_id": job_id,
+            "offer": {"amount": offer, **_OFFER_TERMS},
+            "round": round_num,
+        }, input, send_input)
+    
+    async def _accept(self, url: str, job_id: str, amount: float, input: dict, send_input: bool = True) -> dict:
+        return await self._rpc_with_input(url, "apex/accept", {
+            "job_id": job_id,
+            "terms": {"amount": amount, "currency": "USDC"},
+        }, input, send_input)
+    
+    async def _rpc_with_input(self, url: str, method: str, params: dict, input: dict, send_input: bool) -> dict:
+        """JSON-RPC call that ships input only if the seller doesn't have it cached for the job."""
+        if send_input:
+            params["input"] = input
+            return await self._rpc(url, method, params)
+        
+        response = await self._rpc(url, method, params)
+        if response.get("error", {}).get("code") == _INPUT_REQUIRED:
+            params["input"] = input
+            response = await self._rpc(url, method, params)
+        return response
+    
+    async def _rpc_result(self, url: str, method: str, params: dict) -> Optional[dict]:
+        """JSON-RPC call for optional lookups: the result, or None on any failure."""
+        try:
+            response = await self._rpc(url, method, params)
+        except Exception:
+            return None
+        return response.get("result")
+    
+    async def _rpc(self, url: str, method: str, params: dict) -> dict:
+        """POST a JSON-RPC request and return the decoded response.
         
-        # Include estimate_id if we have one
-        if estimate_id:
-            params["estimate_id"] = estimate_id
+        Transient failures are retried with jittered exponential backoff, capped
+        at _RETRY_MAX_DELAY or the seller's Retry-After. Requests that never
+        connected are retried for every method; timeouts, dropped connections,
+        429 and 5xx only for read-only methods, since a propose, counter or
+        accept the seller already processed must not be applied twice. JSON-RPC
+        errors are returned as-is.
+        """
+        body = _RPC_ENVELOPE % (_next_rpc_id(), method.encode(), _json.dumps(params))
+        retryable = _TRANSIENT_ERRORS if method in _IDEMPOTENT_METHODS else _NOT_SENT_ERRORS
+        # Outside `async with`, fall back to the loop's shared client
+        http = self._http or get_client("buyer", _buyer_client)
         
-        response = await self._http.post(url, json={
-            "jsonrpc": "2.0",
-            "id": str(uuid.uuid4()),
-            "method": "apex/propose",
-            "params": params,
-        })
-        return response.json()
-    
-    async def _counter(self, url: str, job_id: str, offer: float, round_num: int, input: dict) -> dict:
-        response = await self._http.post(url, json={
-            "jsonrpc": "2.0",
-            "id": str(uuid.uuid4()),
-            "method": "apex/counter",
-            "params": {
-                "job_id": job_id,
-                "offer": {"amount": offer, "currency": "USDC", "network": "base"},
-                "round": round_num,
-                "input": input,
-            },
-        })
-        return response.json()
-    
-    async def _accept(self, url: str, job_id: str, amount: float, input: dict) -> dict:
-        response = await self._http.post(url, json={
-            "jsonrpc": "2.0",
-            "id": str(uuid.uuid4()),
-            "method": "apex/accept",
-            "params": {
-                "job_id": job_id,
-                "terms": {"amount": amount, "currency": "USDC"},
-                "input": input,
-            },
-        })
-        return response.json()
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = await http.post(url, content=body)
+            except retryable:
+                if attempt >= self.max_retries:
+                    self._seller_cache.pop(url, None)
+                    raise
+            else:
+                if (
+                    response.status_code not in _RETRY_STATUSES
+                    or attempt >= self.max_retries
+                    or method not in _IDEMPOTENT_METHODS
+                ):
+                    if response.status_code >= 400:
+                        # Seller moved or broke - rediscover it next call
+                        self._seller_cache.pop(url, None)
+                    return _json.loads(response.content)
+            
+            await asyncio.sleep(_retry_delay(attempt, response))
+            attempt += 1
 
 
 def create_buyer(
@@ -781,6 +1220,11 @@ def create_buyer(
     initial_offer_pct: float = 0.6,
     wallet: Optional["Wallet"] = None,
     auto_pay: bool = False,
+    cache_llm: bool = True,
+    max_retries: int = 3,
+    llm_skip_heuristics: bool = True,
+    typing_effect: bool = False,
+    own_client: bool = False,
 ) -> Buyer:
     """Create an APEX buyer with auto-negotiation.
     
@@ -792,6 +1236,18 @@ def create_buyer(
         initial_offer_pct: Starting offer as % of budget (default 60%)
         wallet: Real Wallet instance for payments
         auto_pay: If True, auto-pay on successful negotiation
+        cache_llm: Reuse LLM decisions for equivalent negotiation states (same round,
+            offers within 1% of budget), across buyers in this process
+            (set False to get a fresh, varied reply every round)
+        max_retries: Retries per request on transient network errors or 5xx,
+            with jittered exponential backoff
+        llm_skip_heuristics: With strategy="llm", settle obvious rounds (seller at
+            or below our offer, no budget left, opening ask > 1.5x budget) without
+            an LLM call
+        typing_effect: Type out verbose dialogue character by character
+        own_client: Give this buyer its own HTTP connection pool, closed when
+            its `async with` block exits, instead of the pool shared by all
+            buyers on the event loop
     
     Returns:
         Buyer instance
@@ -830,4 +1286,9 @@ def create_buyer(
         initial_offer_pct=initial_offer_pct,
         wallet=wallet,
         auto_pay=auto_pay,
+        cache_llm=cache_llm,
+        max_retries=max_retries,
+        llm_skip_heuristics=llm_skip_heuristics,
+        typing_effect=typing_effect,
+        own_client=own_client,
     )
\ No newline at end of file
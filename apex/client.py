@@ -8,27 +8,56 @@ Example:
         result = await client.call(agents[0]["url"], "research", {"topic": "AI"})
 """
 
+import asyncio
+import itertools
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import httpx
 
+from . import _json
+from ._http import HTTP2
+
+# JSON-RPC request with the id, method and encoded params filled in per call
+_RPC_ENVELOPE = b'{"jsonrpc":"2.0","id":%d,"method":"%s","params":%s}'
+
 
 @dataclass
 class Client:
     """APEX client for discovering and calling agents."""
     
+    # Offer fields every proposal and counter repeats
+    _OFFER_TERMS = {"network": "base"}
+    
     registry_url: str
     wallet: str | None = None
-    _http: httpx.AsyncClient | None = None
+    _http: httpx.AsyncClient | None = field(default=None, repr=False)
+    # JSON-RPC ids only need to be unique per client; job ids stay uuid4
+    _rpc_ids: "itertools.count[int]" = field(default_factory=lambda: itertools.count(1), init=False, repr=False)
     
     async def __aenter__(self):
-        self._http = httpx.AsyncClient(timeout=60.0)
+        self._client()
         return self
     
     async def __aexit__(self, *args):
-        if self._http:
+        await self.aclose()
+    
+    def _client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client, created on first use so `async with` is optional."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
+                http2=HTTP2,
+                headers={"content-type": "application/json"},
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the HTTP client. Needed only when not using `async with`."""
+        if self._http is not None:
             await self._http.aclose()
+            self._http = None
     
     async def discover(
         self,
@@ -50,12 +79,24 @@ class Client:
         if query:
             params["q"] = query
         
-        response = await self._http.get(
+        response = await self._client().get(
             f"{self.registry_url}/api/discover",
             params=params,
         )
         response.raise_for_status()
-        return response.json().get("agents", [])
+        return _json.loads(response.content).get("agents", [])
+    
+    async def discover_many(self, queries: list[dict]) -> list[list[dict]]:
+        """Run several registry searches concurrently over the pooled client.
+        
+        Args:
+            queries: discover() keyword arguments per search,
+                e.g. [{"capability": "research"}, {"query": "translate"}]
+        
+        Returns:
+            One agent list per query, in the same order
+        """
+        return list(await asyncio.gather(*(self.discover(**q) for q in queries)))
     
     async def call(
         self,
@@ -77,27 +118,13 @@ class Client:
         Returns:
             Agent response
         """
-        response = await self._http.post(
-            url,
-            json={
-                "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
-                "method": "apex/propose",
-                "params": {
-                    "capability": capability,
-                    "input": input,
-                    "job_id": str(uuid.uuid4()),
-                    "offer": {
-                        "amount": offer,
-                        "currency": currency,
-                        "network": "base",
-                    },
-                    "buyer_address": self.wallet or "0xBUYER",
-                },
-            },
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await self._rpc(url, "apex/propose", {
+            "capability": capability,
+            "input": input,
+            "job_id": str(uuid.uuid4()),
+            "offer": {"amount": offer, "currency": currency, **self._OFFER_TERMS},
+            "buyer_address": self.wallet or "0xBUYER",
+        })
         
         if "error" in result:
             raise Exception(result["error"].get("message", "Unknown error"))
@@ -119,27 +146,13 @@ class Client:
         """
         job_id = str(uuid.uuid4())
         
-        response = await self._http.post(
-            url,
-            json={
-                "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
-                "method": "apex/propose",
-                "params": {
-                    "capability": capability,
-                    "input": input,
-                    "job_id": job_id,
-                    "offer": {
-                        "amount": offer,
-                        "currency": currency,
-                        "network": "base",
-                    },
-                    "buyer_address": self.wallet or "0xBUYER",
-                },
-            },
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await self._rpc(url, "apex/propose", {
+            "capability": capability,
+            "input": input,
+            "job_id": job_id,
+            "offer": {"amount": offer, "currency": currency, **self._OFFER_TERMS},
+            "buyer_address": self.wallet or "0xBUYER",
+        })
         
         if "error" in result:
             raise Exception(result["error"].get("message", "Unknown error"))
@@ -156,26 +169,12 @@ class Client:
         currency: str = "USDC",
     ) -> dict:
         """Counter an agent's offer."""
-        response = await self._http.post(
-            url,
-            json={
-                "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
-                "method": "apex/counter",
-                "params": {
-                    "job_id": job_id,
-                    "offer": {
-                        "amount": offer,
-                        "currency": currency,
-                        "network": "base",
-                    },
-                    "round": round,
-                    "input": input or {},
-                },
-            },
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await self._rpc(url, "apex/counter", {
+            "job_id": job_id,
+            "offer": {"amount": offer, "currency": currency, **self._OFFER_TERMS},
+            "round": round,
+            "input": input or {},
+        })
         
         if "error" in result:
             raise Exception(result["error"].get("message", "Unknown error"))
@@ -190,21 +189,11 @@ class Client:
         input: dict | None = None,
     ) -> dict:
         """Accept an agent's counter-offer."""
-        response = await self._http.post(
-            url,
-            json={
-                "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
-                "method": "apex/accept",
-                "params": {
-                    "job_id": job_id,
-                    "terms": terms,
-                    "input": input or {},
-                },
-            },
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await self._rpc(url, "apex/accept", {
+            "job_id": job_id,
+            "terms": terms,
+            "input": input or {},
+        })
         
         if "error" in result:
             raise Exception(result["error"].get("message", "Unknown error"))
@@ -213,17 +202,15 @@ class Client:
     
     async def reject(self, url: str, job_id: str, reason: str | None = None) -> dict:
         """Reject/walk away from negotiation."""
-        response = await self._http.post(
-            url,
-            json={
-                "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
-                "method": "apex/reject",
-                "params": {
-                    "job_id": job_id,
-                    "reason": reason,
-                },
-            },
-        )
+        result = await self._rpc(url, "apex/reject", {
+            "job_id": job_id,
+            "reason": reason,
+        })
+        return result.get("result", {})
+    
+    async def _rpc(self, url: str, method: str, params: dict) -> dict:
+        """POST a JSON-RPC request and return the decoded response."""
+        body = _RPC_ENVELOPE % (next(self._rpc_ids), method.encode(), _json.dumps(params))
+        response = await self._client().post(url, content=body)
         response.raise_for_status()
-        return response.json().get("result", {})
+        return _json.loads(response.content)
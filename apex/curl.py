@@ -16,15 +16,19 @@ Example:
 """
 
 import json
-import os
 import re
 import shlex
 from typing import Any
 
 import httpx
 
+from ._http import HTTP2, get_client
+from .api import _compile_path, _compile_template, _extract_parts, _render
 from .pricing import Pricing
 
+# $VAR in a curl command (rewritten to {{env.VAR}})
+_ENV_RE = re.compile(r"\$(\w+)")
+
 
 def from_curl(
     name: str,
@@ -63,36 +67,11 @@ def from_curl(
     # Parse curl command
     endpoint, method, headers, body = _parse_curl(curl)
     
-    # Create handler
-    async def curl_handler(input_data: dict) -> dict:
-        context = {"input": input_data, "env": dict(os.environ)}
-        
-        # Substitute templates
-        req_endpoint = _substitute(endpoint, context)
-        req_headers = _substitute(headers, context)
-        req_body = _substitute(body, context) if body else None
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method=method,
-                url=req_endpoint,
-                headers=req_headers,
-                json=req_body if isinstance(req_body, dict) else None,
-                content=req_body if isinstance(req_body, str) else None,
-            )
-            response.raise_for_status()
-            
-            try:
-                response_data = response.json()
-            except json.JSONDecodeError:
-                response_data = {"text": response.text}
-        
-        # Extract output if path specified
-        if output:
-            result = _extract_path(response_data, output)
-            return {"result": result}
-        
-        return {"result": response_data}
+    # Parse templates once; requests only fill in the placeholders
+    compiled_endpoint = _compile_template(endpoint)
+    compiled_headers = _compile_template(headers)
+    compiled_body = _compile_template(body) if body else None
+    output_parts = _compile_path(output) if output else ()
     
     agent = Agent(
         name=name,
@@ -103,7 +82,40 @@ def from_curl(
         wallet=wallet,
     )
     
+    # One connection pool per agent and event loop, created on first request
+    # and closed by agent.aclose() / apex.shutdown()
+    client_name = f"curl:{agent.agent_id}"
+    
+    # Create handler
+    async def curl_handler(input_data: dict) -> dict:
+        # Parts without {{...}} (after $VAR -> {{env.VAR}}) come back as parsed
+        req_endpoint = _render(compiled_endpoint, input_data)
+        req_headers = _render(compiled_headers, input_data)
+        req_body = _render(compiled_body, input_data) if body else None
+        
+        client = get_client(client_name, _curl_client)
+        response = await client.request(
+            method=method,
+            url=req_endpoint,
+            headers=req_headers,
+            json=req_body if isinstance(req_body, dict) else None,
+            content=req_body if isinstance(req_body, str) else None,
+        )
+        response.raise_for_status()
+        
+        try:
+            response_data = response.json()
+        except json.JSONDecodeError:
+            response_data = {"text": response.text}
+        
+        # Extract output if path specified
+        if output_parts:
+            return {"result": _extract_parts(response_data, output_parts)}
+        
+        return {"result": response_data}
+    
     agent._handler = curl_handler
+    agent._client_name = client_name
     agent._source_type = "curl"
     agent._source_config = {
         "curl": curl,
@@ -119,6 +131,18 @@ def from_curl(
     return agent
 
 
+def _curl_client() -> httpx.AsyncClient:
+    """Pooled client for a curl-wrapping agent.
+    
+    15s keep-alive stays under common upstream idle timeouts (nginx: 75s).
+    """
+    return httpx.AsyncClient(
+        timeout=60.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=15.0),
+        http2=HTTP2,
+    )
+
+
 def _parse_curl(curl: str) -> tuple[str, str, dict, Any]:
     """Parse a curl command into components.
     
@@ -129,7 +153,7 @@ def _parse_curl(curl: str) -> tuple[str, str, dict, Any]:
     curl = curl.replace("\\\n", " ").replace("\\\r\n", " ").strip()
     
     # Convert $VAR to {{env.VAR}} for consistency
-    curl = re.sub(r"\$(\w+)", r"{{env.\1}}", curl)
+    curl = _ENV_RE.sub(r"{{env.\1}}", curl)
     
     try:
         tokens = shlex.split(curl)
@@ -183,47 +207,3 @@ def _parse_curl(curl: str) -> tuple[str, str, dict, Any]:
         i += 1
     
     return endpoint, method, headers, body
-
-
-def _substitute(template: Any, context: dict) -> Any:
-    """Substitute {{variable}} placeholders."""
-    if isinstance(template, str):
-        def replace(match):
-            path = match.group(1).strip()
-            
-            if path.startswith("env."):
-                return os.environ.get(path[4:], "")
-            
-            parts = path.split(".")
-            value = context
-            for part in parts:
-                if isinstance(value, dict):
-                    value = value.get(part, "")
-                else:
-                    value = ""
-                    break
-            return str(value) if value else ""
-        
-        return re.sub(r"\{\{(.+?)\}\}", replace, template)
-    
-    elif isinstance(template, dict):
-        return {k: _substitute(v, context) for k, v in template.items()}
-    
-    elif isinstance(template, list):
-        return [_substitute(item, context) for item in template]
-    
-    return template
-
-
-def _extract_path(data: dict, path: str) -> Any:
-    """Extract value from nested dict using dot notation."""
-    parts = path.split(".")
-    value = data
-    for part in parts:
-        if isinstance(value, dict):
-            value = value.get(part)
-        elif isinstance(value, list) and part.isdigit():
-            value = value[int(part)]
-        else:
-            return None
-    return value
@@ -20,15 +20,23 @@ Example:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import heapq
 import os
+import time
 import uuid
+import warnings
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
 from typing import Optional, Literal
 
+from . import _json
+from ._http import get_llm_client
+
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 
@@ -37,6 +45,9 @@ ESTIMATE_EXPIRY_SECONDS = 300  # 5 minutes
 # Minimum is 80% of estimate (seller's floor for negotiation)
 MINIMUM_FLOOR_PCT = 0.80
 
+_CENT = Decimal("0.01")
+_FLOOR = Decimal(str(MINIMUM_FLOOR_PCT))
+
 MULTIPLIER_GUIDE = """
 Multiplier guide:
 - 0.25x: Trivial (simple lookup, basic question)
@@ -48,10 +59,23 @@ Multiplier guide:
 - 4.0x: Very hard (novel territory, extensive work)
 """
 
+# LRU of parsed LLM answers keyed by (model, system prompt, user prompt), each
+# kept for ESTIMATE_EXPIRY_SECONDS: {key: (stored_at, multiplier, reasoning)}
+_ESTIMATES: "OrderedDict[tuple[str, str, str], tuple[float, float, str]]" = OrderedDict()
+_ESTIMATES_MAX = 1024
+
+# Estimation LLM calls in flight per event loop, so a burst of proposals
+# queues here instead of tripping provider rate limits. APEX_LLM_CONCURRENCY
+# overrides it; read when a loop first estimates, so a bad value can't break import.
+LLM_CONCURRENCY = 8
+_LLM_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 # ─── Data Classes ─────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class TaskEstimate:
     """Result of task complexity estimation."""
     amount: float           # AI's fair value estimate
@@ -67,16 +91,20 @@ class TaskEstimate:
     def low(self) -> float:
         return self.minimum
     
-    def to_dict(self) -> dict:
-        return {
-            "amount": round(self.amount, 2),
-            "minimum": round(self.minimum, 2),
-            "low": round(self.minimum, 2),  # backwards compat
+    # amount/minimum are whole cents already (see _calculate_estimate)
+    def to_dict(self, *, legacy: bool = False) -> dict:
+        """Wire format. legacy=True adds the deprecated "low" alias of minimum."""
+        data = {
+            "amount": self.amount,
+            "minimum": self.minimum,
             "currency": self.currency,
         }
+        if legacy:
+            data["low"] = self.minimum
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class EstimateResult:
     """Full estimate response for protocol."""
     estimate_id: str
@@ -95,47 +123,63 @@ class EstimateResult:
     def expired(self) -> bool:
         return datetime.now(timezone.utc) > self.expires_at
     
-    def to_dict(self) -> dict:
+    def to_dict(self, *, legacy: bool = False) -> dict:
         return {
             "status": "estimated",
             "estimate_id": self.estimate_id,
             "expires_at": self.expires_at.isoformat(),
-            "estimate": self.estimate.to_dict(),
+            "estimate": self.estimate.to_dict(legacy=legacy),
             "negotiation": {
-                "target": round(self.target, 2),
-                "floor": round(self.floor, 2),
+                "target": self.target,
+                "floor": self.floor,
             },
             "factors": self.factors,
             "reasoning": self.reasoning,
         }
+    
+    def to_json(self, *, legacy: bool = False) -> bytes:
+        """to_dict() as compact JSON bytes (orjson when installed)."""
+        return _json.dumps(self.to_dict(legacy=legacy))
 
 
 # ─── Estimation Logic ─────────────────────────────────────────────────────────
 
+# Parsed .env contents, once per process (empty if no file was found)
+_ENV_CACHE: Optional[dict[str, str]] = None
+
+
 def _load_env():
     """Load API keys from .env file if not already set."""
-    if os.environ.get("_APEX_ENV_LOADED"):
+    global _ENV_CACHE
+    if _ENV_CACHE is not None or os.environ.get("_APEX_ENV_LOADED"):
+        return
+    # The only keys estimation needs - skip the filesystem once both are set
+    # (either may be missing and still come from .env; setdefault keeps the other)
+    if os.environ.get("OPENAI_API_KEY") and os.environ.get("ANTHROPIC_API_KEY"):
         return
     
+    cwd = Path.cwd()
     search_paths = [
-        Path.cwd() / ".env",
-        Path.cwd().parent / ".env",
+        cwd / ".env",
+        cwd.parent / ".env",
         Path.home() / ".env",
     ]
     
+    _ENV_CACHE = {}
     for env_path in search_paths:
-        if env_path.exists():
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        if key not in os.environ:
-                            os.environ[key] = value
-            break
-    
+        try:
+            text = env_path.read_text()
+        except OSError:
+            continue
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, value = line.split("=", 1)
+                _ENV_CACHE[key.strip()] = value.strip().strip('"').strip("'")
+        break
+    
+    for key, value in _ENV_CACHE.items():
+        os.environ.setdefault(key, value)
     os.environ["_APEX_ENV_LOADED"] = "1"
 
 
@@ -167,14 +211,27 @@ async def estimate_task(
     task = input.get("topic", input.get("query", input.get("task", str(input))))
     user_prompt = f"Task: {task}"
     
-    # Call LLM
-    try:
-        response = _call_llm(model, system_prompt, user_prompt)
-        multiplier, reasoning = _parse_estimation_response(response)
-    except Exception:
-        # LLM didn't return valid JSON, use standard estimate
-        multiplier = 1.0
-        reasoning = "Standard complexity estimate."
+    # Identical prompts get the same answer - skip the LLM on repeats
+    cache_key = (model, system_prompt, user_prompt)
+    cached = _ESTIMATES.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < ESTIMATE_EXPIRY_SECONDS:
+        _ESTIMATES.move_to_end(cache_key)
+        _, multiplier, reasoning = cached
+    else:
+        # Call LLM
+        try:
+            async with _llm_semaphore():
+                response = await _call_llm(model, system_prompt, user_prompt)
+            multiplier, reasoning = _parse_estimation_response(response)
+        except Exception:
+            # LLM didn't return valid JSON, use standard estimate
+            multiplier = 1.0
+            reasoning = "Standard complexity estimate."
+        else:
+            _ESTIMATES[cache_key] = (time.monotonic(), multiplier, reasoning)
+            _ESTIMATES.move_to_end(cache_key)
+            if len(_ESTIMATES) > _ESTIMATES_MAX:
+                _ESTIMATES.popitem(last=False)
     
     # Calculate estimate
     estimate = _calculate_estimate(base, multiplier)
@@ -246,30 +303,55 @@ def _calculate_estimate(
     # Clamp multiplier to reasonable bounds
     multiplier = max(0.25, min(4.0, multiplier))
     
-    # Calculate
-    amount = base * multiplier
-    minimum = amount * MINIMUM_FLOOR_PCT  # 80% floor
+    # Calculate in exact cents (20.00 * 1.2 is 24.000000000000004 as floats)
+    amount = (Decimal(str(base)) * Decimal(str(multiplier))).quantize(_CENT, ROUND_HALF_UP)
+    minimum = (amount * _FLOOR).quantize(_CENT, ROUND_HALF_UP)  # 80% floor
     
     return TaskEstimate(
-        amount=round(amount, 2),
-        minimum=round(minimum, 2),
+        amount=float(amount),
+        minimum=float(minimum),
         multiplier=multiplier,
     )
 
 
-def _call_llm(model: str, system: str, user: str) -> str:
+def _llm_concurrency() -> int:
+    """APEX_LLM_CONCURRENCY, or LLM_CONCURRENCY (with a warning) if unset or invalid."""
+    raw = os.environ.get("APEX_LLM_CONCURRENCY")
+    if raw is None:
+        return LLM_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        warnings.warn(
+            f"Ignoring APEX_LLM_CONCURRENCY={raw!r} (expected a positive integer); using {LLM_CONCURRENCY}",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return LLM_CONCURRENCY
+    return value
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """The running loop's cap on concurrent estimation LLM calls."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(_llm_concurrency())
+    return semaphore
+
+
+async def _call_llm(model: str, system: str, user: str) -> str:
     """Call LLM (OpenAI or Anthropic)."""
     if "claude" in model.lower():
-        return _call_anthropic(model, system, user)
-    return _call_openai(model, system, user)
+        return await _call_anthropic(model, system, user)
+    return await _call_openai(model, system, user)
 
 
-def _call_openai(model: str, system: str, user: str) -> str:
-    """Call OpenAI."""
-    from openai import OpenAI
-    
-    client = OpenAI()
-    response = client.chat.completions.create(
+async def _call_openai(model: str, system: str, user: str) -> str:
+    """Call OpenAI, returning as soon as the JSON reply is complete."""
+    stream = await get_llm_client("openai").chat.completions.create(
         model=model,
         max_completion_tokens=100,
         temperature=0.1,  # Very low temp for deterministic JSON
@@ -277,23 +359,38 @@ def _call_openai(model: str, system: str, user: str) -> str:
             {"role": "system", "content": system},
             {"role": "user", "content": user},
         ],
+        stream=True,
     )
-    return response.choices[0].message.content
-
-
-def _call_anthropic(model: str, system: str, user: str) -> str:
-    """Call Anthropic."""
-    import anthropic
-    
-    client = anthropic.Anthropic()
-    response = client.messages.create(
+    text = ""
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                text += delta
+                if "}" in delta and _json.has_json_object(text):
+                    break
+    finally:
+        await stream.close()
+    return text
+
+
+async def _call_anthropic(model: str, system: str, user: str) -> str:
+    """Call Anthropic, returning as soon as the JSON reply is complete."""
+    text = ""
+    async with get_llm_client("anthropic").messages.stream(
         model=model,
         max_tokens=100,
         temperature=0.1,  # Very low temp for deterministic JSON
         system=system,
         messages=[{"role": "user", "content": user}],
-    )
-    return response.content[0].text
+    ) as stream:
+        async for delta in stream.text_stream:
+            text += delta
+            if "}" in delta and _json.has_json_object(text):
+                break
+    return text
 
 
 def _parse_estimation_response(text: str) -> tuple[float, str]:
@@ -312,7 +409,7 @@ def _parse_estimation_response(text: str) -> tuple[float, str]:
     # Extract JSON
     if "{" in text:
         json_str = text[text.index("{"):text.rindex("}") + 1]
-        data = json.loads(json_str)
+        data = _json.loads(json_str)
     else:
         raise ValueError(f"No JSON in response: {text}")
     
@@ -342,10 +439,13 @@ class EstimateCache:
     
     def __init__(self):
         self._cache: dict[str, EstimateResult] = {}
+        # (expires_at, estimate_id), soonest first
+        self._expiry: list[tuple[datetime, str]] = []
     
     def store(self, result: EstimateResult) -> None:
         """Store an estimate."""
         self._cache[result.estimate_id] = result
+        heapq.heappush(self._expiry, (result.expires_at, result.estimate_id))
         self._cleanup()
     
     def get(self, estimate_id: str) -> Optional[EstimateResult]:
@@ -362,8 +462,11 @@ class EstimateCache:
         self._cache.pop(estimate_id, None)
     
     def _cleanup(self) -> None:
-        """Remove expired estimates."""
+        """Remove expired estimates, popping only the expired head of the heap."""
         now = datetime.now(timezone.utc)
-        expired = [k for k, v in self._cache.items() if v.expires_at < now]
-        for k in expired:
-            del self._cache[k]
\ No newline at end of file
+        while self._expiry and self._expiry[0][0] < now:
+            _, estimate_id = heapq.heappop(self._expiry)
+            # Skip heap entries for estimates since removed or stored again
+            result = self._cache.get(estimate_id)
+            if result is not None and result.expires_at < now:
+                del self._cache[estimate_id]
\ No newline at end of file
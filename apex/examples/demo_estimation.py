@@ -15,23 +15,42 @@ Key insight: Negotiation only makes sense when:
 import asyncio
 import sys
 import os
-import time
+import re
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from apex import create_agent, create_buyer, Negotiated
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from apex import create_agent, create_buyer, Negotiated, install_fast_loop, shutdown
 from apex.estimation import estimate_task
+from apex._json import dumps, loads  # orjson when installed (apex-protocol[fast])
 
 BASE_RATE = 20.00
 
+DOUBLE_RULE = "=" * 65
+RULE = "─" * 65
+THIN_RULE = "─" * 40
+
+# OPENAI_API_KEY=value line in a .env file (quoted or bare, optional trailing comment)
+_OPENAI_KEY_RE = re.compile(
+    rb"""(?m)^[ \t]*OPENAI_API_KEY[ \t]*=[ \t]*(?:"([^"\n]*)"|'([^'\n]*)'|([^\n#]*?))[ \t]*(?:#.*)?\r?$"""
+)
+
 
-def type_text(text: str, delay: float = 0.015):
-    """Print with typing effect."""
-    for char in text:
-        sys.stdout.write(char)
+async def type_text(text: str, delay: float = 0.015, chunk: int = 4):
+    """Print with typing effect (plain print when piped or APEX_NO_TYPE is set)."""
+    if not sys.stdout.isatty() or os.environ.get("APEX_NO_TYPE"):
+        print(text)
+        return
+    for i in range(0, len(text), chunk):
+        sys.stdout.write(text[i:i + chunk])
         sys.stdout.flush()
-        time.sleep(delay)
+        await asyncio.sleep(delay * chunk)
     print()
 
 
@@ -49,17 +68,15 @@ def load_openai_api_key():
     ]
     
     for env_path in search_paths:
-        if env_path.exists():
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        if key == "OPENAI_API_KEY" and key not in os.environ:
-                            os.environ[key] = value
-                            return
+        try:
+            data = env_path.read_bytes()
+        except OSError:
+            continue
+        match = _OPENAI_KEY_RE.search(data)
+        if match:
+            value = match.group(1) or match.group(2) or match.group(3) or b""
+            os.environ["OPENAI_API_KEY"] = value.decode().strip()
+            return
 
 
 async def run_demo():
@@ -72,9 +89,9 @@ async def run_demo():
         print("   Please set OPENAI_API_KEY environment variable or add it to a .env file")
         return
     print()
-    print("=" * 65)
+    print(DOUBLE_RULE)
     print("  APEX Protocol - Estimation + Negotiation Demo")
-    print("=" * 65)
+    print(DOUBLE_RULE)
     print()
     
     # ─── Setup Agent ──────────────────────────────────────────────────
@@ -99,20 +116,14 @@ async def run_demo():
     )
     
     # Start server
-    import threading
-    import uvicorn
-    from starlette.applications import Starlette
-    from starlette.requests import Request
-    from starlette.responses import JSONResponse
-    from starlette.routing import Route
-    
-    async def handle(r: Request) -> JSONResponse:
-        return JSONResponse(await agent.handle(await r.json()))
+    async def handle(r: Request) -> Response:
+        return Response(dumps(await agent.handle(loads(await r.body()))), media_type="application/json")
     
     app = Starlette(routes=[Route("/apex", handle, methods=["POST"])])
-    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="error"))
-    threading.Thread(target=server.run, daemon=True).start()
-    await asyncio.sleep(1)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="error", access_log=False))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
     
     print("🤖 Research Agent running on http://127.0.0.1:8001/apex")
     print()
@@ -121,9 +132,9 @@ async def run_demo():
     # TASK 1: Standard Research
     # ══════════════════════════════════════════════════════════════════
     
-    print("─" * 65)
+    print(RULE)
     print("  TASK 1: Standard Research")
-    print("─" * 65)
+    print(RULE)
     print()
     
     task1 = "Find the top 5 Python ORMs, compare GitHub stars and use cases."
@@ -132,7 +143,7 @@ async def run_demo():
     
     # Step 1: Estimate
     print("💡 ESTIMATION")
-    print("─" * 40)
+    print(THIN_RULE)
     
     est1 = await estimate_task(
         input={"topic": task1},
@@ -142,7 +153,7 @@ async def run_demo():
     )
     
     print(f"   AI Analysis: ", end="")
-    type_text(est1.reasoning or "Standard research task.", delay=0.012)
+    await type_text(est1.reasoning or "Standard research task.", delay=0.012)
     print()
     print(f"   Estimate:  ${est1.estimate.amount:.2f}")
     print(f"   Minimum:   ${est1.estimate.minimum:.2f}")
@@ -153,12 +164,14 @@ async def run_demo():
     buyer_budget_1 = est1.estimate.amount * 0.92  # 92% of estimate
     
     print("💬 NEGOTIATION")
-    print("─" * 40)
+    print(THIN_RULE)
     print(f"   Seller target: ${est1.estimate.amount:.2f}")
     print(f"   Buyer budget:  ${buyer_budget_1:.2f} (92% - below target!)")
     print(f"   Seller floor:  ${est1.estimate.minimum:.2f}")
     print()
     
+    # Both buyers draw on the same per-loop connection pool, so the second
+    # negotiation reuses the keep-alive connection to the seller
     buyer1 = create_buyer(budget=buyer_budget_1, strategy="llm", model="gpt-5.1")
     async with buyer1:
         r1 = await buyer1.call(
@@ -183,9 +196,9 @@ async def run_demo():
     
     print()
     print()
-    print("─" * 65)
+    print(RULE)
     print("  TASK 2: Complex Cross-Domain Analysis")
-    print("─" * 65)
+    print(RULE)
     print()
     
     task2 = "Compare REST vs GraphQL vs gRPC for fintech: latency, compliance, case studies from Stripe/Square."
@@ -194,7 +207,7 @@ async def run_demo():
     
     # Step 1: Estimate
     print("💡 ESTIMATION")
-    print("─" * 40)
+    print(THIN_RULE)
     
     est2 = await estimate_task(
         input={"topic": task2},
@@ -204,7 +217,7 @@ async def run_demo():
     )
     
     print(f"   AI Analysis: ", end="")
-    type_text(est2.reasoning or "Complex cross-domain analysis.", delay=0.012)
+    await type_text(est2.reasoning or "Complex cross-domain analysis.", delay=0.012)
     print()
     print(f"   Estimate:  ${est2.estimate.amount:.2f}")
     print(f"   Minimum:   ${est2.estimate.minimum:.2f}")
@@ -214,7 +227,7 @@ async def run_demo():
     buyer_budget_2 = est2.estimate.amount * 0.88  # 88% - tighter than task 1
     
     print("💬 NEGOTIATION")
-    print("─" * 40)
+    print(THIN_RULE)
     print(f"   Seller target: ${est2.estimate.amount:.2f}")
     print(f"   Buyer budget:  ${buyer_budget_2:.2f} (88% - below target!)")
     print(f"   Seller floor:  ${est2.estimate.minimum:.2f}")
@@ -244,28 +257,36 @@ async def run_demo():
     
     print()
     print()
-    print("─" * 65)
+    print(RULE)
     print("  TASK 3: Same Task, Budget Too Low")
-    print("─" * 65)
+    print(RULE)
     print()
     
     print(f'📋 "{task2[:50]}..." (budget: $15)')
     print()
     
-    # Step 1: Estimate (reuse est2)
+    # Step 1: Estimate (same input as task 2 - estimate_task reuses its answer for this run)
     print("💡 ESTIMATION")
-    print("─" * 40)
-    print(f"   Estimate:  ${est2.estimate.amount:.2f}")
-    print(f"   Minimum:   ${est2.estimate.minimum:.2f}")
+    print(THIN_RULE)
+    
+    est3 = await estimate_task(
+        input={"topic": task2},
+        base=BASE_RATE,
+        model="gpt-5.1",
+        capability="research",
+    )
+    
+    print(f"   Estimate:  ${est3.estimate.amount:.2f}")
+    print(f"   Minimum:   ${est3.estimate.minimum:.2f}")
     print()
     
     # Check budget before negotiating
     buyer_budget = 15.00
-    if buyer_budget < est2.estimate.minimum:
+    if buyer_budget < est3.estimate.minimum:
         print("⚠️  BUDGET CHECK")
-        print("─" * 40)
+        print(THIN_RULE)
         print(f"   Buyer budget:   ${buyer_budget:.2f}")
-        print(f"   Seller minimum: ${est2.estimate.minimum:.2f}")
+        print(f"   Seller minimum: ${est3.estimate.minimum:.2f}")
         print()
         print("   ❌ No negotiation - buyer can't afford seller's minimum.")
     else:
@@ -276,24 +297,27 @@ async def run_demo():
     # Summary
     # ══════════════════════════════════════════════════════════════════
     
-    print()
-    print()
-    print("=" * 65)
-    print("  SUMMARY")
-    print("=" * 65)
-    print()
-    
+    lines = ["", "", DOUBLE_RULE, "  SUMMARY", DOUBLE_RULE, ""]
     if r1.success:
-        print(f"  • Task 1: ${est1.estimate.amount:.2f} estimate → ${r1.final_price:.2f} deal")
+        lines.append(f"  • Task 1: ${est1.estimate.amount:.2f} estimate → ${r1.final_price:.2f} deal")
     if r2.success:
-        print(f"  • Task 2: ${est2.estimate.amount:.2f} estimate → ${r2.final_price:.2f} deal")
-    print(f"  • Task 3: ${est2.estimate.amount:.2f} estimate → budget too low, no negotiation")
-    print()
-    print("  Same agent. AI adjusts price based on task complexity.")
-    print()
-    print("=" * 65)
-    print()
+        lines.append(f"  • Task 2: ${est2.estimate.amount:.2f} estimate → ${r2.final_price:.2f} deal")
+    lines += [
+        f"  • Task 3: ${est3.estimate.amount:.2f} estimate → budget too low, no negotiation",
+        "",
+        "  Same agent. AI adjusts price based on task complexity.",
+        "",
+        DOUBLE_RULE,
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    
+    await shutdown()  # close the shared buyer/LLM connections
+    server.should_exit = True
+    await server_task
 
 
 if __name__ == "__main__":
+    install_fast_loop()  # uvloop when installed: pip install apex-protocol[server]
     asyncio.run(run_demo())
\ No newline at end of file
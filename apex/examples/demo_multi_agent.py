@@ -6,22 +6,29 @@ Each agent negotiates independently and gets paid.
 
 Flow:
 1. Buyer needs a research report on AI agents
-2. Buyer negotiates with Research Agent (data gathering)
-3. Buyer negotiates with Writing Agent (report writing)  
+2. Buyer negotiates with Research Agent (data gathering) and
+   Writing Agent (report writing) at the same time
+3. Writing Agent's job gets the research output once research is done
 4. Both agents get paid on-chain
 """
 
 import asyncio
 import sys
 import os
-import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 os.environ["APEX_NETWORK"] = "sepolia"
 
-from apex import create_agent, create_buyer, Negotiated
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from apex import create_agent, create_buyer, Negotiated, install_fast_loop, shutdown
 from apex.payments import Wallet, Payment
+from apex._json import dumps, loads  # orjson when installed (apex-protocol[fast])
 
 
 # ─── Colors ───────────────────────────────────────────────────────────────────
@@ -38,25 +45,48 @@ class C:
     MAGENTA = "\033[95m"
 
 
-def type_text(text: str, delay: float = 0.008):
-    """Print text with typing effect."""
-    for char in text:
-        sys.stdout.write(char)
+WIDE_RULE = "═" * 70
+RULE = "─" * 70
+
+# Writing job input until the research output is available
+RESEARCH_PENDING = "pending:research-job"
+
+
+async def type_text(text: str, delay: float = 0.008, chunk: int = 4):
+    """Print text with typing effect (plain print when piped or APEX_NO_TYPE is set)."""
+    if not sys.stdout.isatty() or os.environ.get("APEX_NO_TYPE"):
+        print(text)
+        return
+    for i in range(0, len(text), chunk):
+        sys.stdout.write(text[i:i + chunk])
         sys.stdout.flush()
-        time.sleep(delay)
+        await asyncio.sleep(delay * chunk)
     print()
 
 
+async def spinner(message: str, stop: asyncio.Event):
+    """Show a spinner until stop is set."""
+    chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+    i = 0
+    while not stop.is_set():
+        sys.stdout.write(f"\r{C.DIM}  {chars[i % len(chars)]} {message}{C.RESET}")
+        sys.stdout.flush()
+        i += 1
+        await asyncio.sleep(0.1)
+    sys.stdout.write("\x1b[2K\r")  # erase the spinner line
+    sys.stdout.flush()
+
+
 def header(text: str):
-    print(f"\n{C.CYAN}{'═'*70}{C.RESET}")
+    print(f"\n{C.CYAN}{WIDE_RULE}{C.RESET}")
     print(f"{C.BOLD}  {text}{C.RESET}")
-    print(f"{C.CYAN}{'═'*70}{C.RESET}")
+    print(f"{C.CYAN}{WIDE_RULE}{C.RESET}")
 
 
 def section(emoji: str, text: str):
-    print(f"\n{C.DIM}{'─'*70}{C.RESET}")
+    print(f"\n{C.DIM}{RULE}{C.RESET}")
     print(f"{C.BOLD}{emoji} {text}{C.RESET}")
-    print(f"{C.DIM}{'─'*70}{C.RESET}")
+    print(f"{C.DIM}{RULE}{C.RESET}")
 
 
 def agent_header(name: str, color: str, price_range: str, buyer_budget: float):
@@ -122,10 +152,18 @@ The buyer will negotiate with each agent independently.
             "data_points": 47,
         }
     
+    # Writing is negotiated alongside research, so its job input carries a
+    # placeholder that resolves to the research output once that deal is done
+    research_output = asyncio.get_running_loop().create_future()
+    
     async def writing_handler(input_data: dict) -> dict:
         topic = input_data.get("topic", "unknown")
+        research_data = input_data.get("research_data")
+        if research_data == RESEARCH_PENDING:
+            research_data = await research_output
+        sources = len((research_data or {}).get("sources", []))
         return {
-            "result": f"Report written: '{topic}' - 2,500 words",
+            "result": f"Report written: '{topic}' - 2,500 words from {sources} research sources",
             "sections": ["Introduction", "Methodology", "Findings", "Conclusion"],
             "format": "markdown",
         }
@@ -160,32 +198,29 @@ The buyer will negotiate with each agent independently.
     
     # ─── Start Servers ────────────────────────────────────────────────
     
-    import threading
-    import uvicorn
-    from starlette.applications import Starlette
-    from starlette.requests import Request
-    from starlette.responses import JSONResponse
-    from starlette.routing import Route
+    async def handle_research(request: Request) -> Response:
+        body = await research_agent.handle(loads(await request.body()))
+        return Response(dumps(body), media_type="application/json")
     
-    async def handle_research(request: Request) -> JSONResponse:
-        return JSONResponse(await research_agent.handle(await request.json()))
-    
-    async def handle_writing(request: Request) -> JSONResponse:
-        return JSONResponse(await writing_agent.handle(await request.json()))
+    async def handle_writing(request: Request) -> Response:
+        body = await writing_agent.handle(loads(await request.body()))
+        return Response(dumps(body), media_type="application/json")
     
     app = Starlette(routes=[
         Route("/research", handle_research, methods=["POST"]),
         Route("/writing", handle_writing, methods=["POST"]),
     ])
     
-    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="error"))
-    threading.Thread(target=server.run, daemon=True).start()
-    await asyncio.sleep(1)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="error", access_log=False))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
     
-    # ─── Negotiation 1: Research Agent ────────────────────────────────
+    # ─── Negotiations (in parallel) ───────────────────────────────────
     
-    section("💬", "NEGOTIATION 1: Research Agent")
+    section("💬", "NEGOTIATIONS: Research Agent + Writing Agent (in parallel)")
     agent_header("Research Agent", C.GREEN, "$0.08 - $0.20", 0.12)
+    agent_header("Writing Agent", C.MAGENTA, "$0.06 - $0.15", 0.10)
     
     buyer1 = create_buyer(
         budget=0.12,
@@ -196,28 +231,6 @@ The buyer will negotiate with each agent independently.
         auto_pay=False,
     )
     
-    async with buyer1:
-        result1 = await buyer1.call(
-            url="http://127.0.0.1:8001/research",
-            capability="research",
-            input={"topic": "AI agent communication protocols"},
-            max_rounds=5,
-            verbose=True,
-        )
-    
-    if not result1.success:
-        print(f"{C.RED}❌ Failed to negotiate with Research Agent{C.RESET}")
-        return
-    
-    deal_box("Research Agent", result1.final_price, C.GREEN)
-    
-    await asyncio.sleep(0.5)
-    
-    # ─── Negotiation 2: Writing Agent ─────────────────────────────────
-    
-    section("💬", "NEGOTIATION 2: Writing Agent")
-    agent_header("Writing Agent", C.MAGENTA, "$0.06 - $0.15", 0.10)
-    
     buyer2 = create_buyer(
         budget=0.10,
         strategy="llm",
@@ -227,19 +240,39 @@ The buyer will negotiate with each agent independently.
         auto_pay=False,
     )
     
-    async with buyer2:
-        result2 = await buyer2.call(
-            url="http://127.0.0.1:8001/writing",
-            capability="writing",
-            input={"topic": "AI agent communication protocols", "research_data": result1.output},
-            max_rounds=5,
-            verbose=True,
-        )
+    # Separate budgets, one connection pool: buyers on the same event loop
+    # share it unless created with own_client=True
+    async def negotiate(buyer, url: str, capability: str, input: dict):
+        async with buyer:
+            return await buyer.call(url=url, capability=capability, input=input, max_rounds=5, verbose="batch")
+    
+    async def research_then_publish():
+        result = None
+        try:
+            result = await negotiate(buyer1, "http://127.0.0.1:8001/research", "research",
+                                     {"topic": "AI agent communication protocols"})
+            return result
+        finally:
+            # Hand the research to the writing job (None if research fell through)
+            research_output.set_result(result.output if result is not None and result.success else None)
+    
+    # Both negotiations run at once; the writing job waits for the research
+    # output before it runs. Each transcript prints as a block when its
+    # negotiation finishes.
+    result1, result2 = await asyncio.gather(
+        research_then_publish(),
+        negotiate(buyer2, "http://127.0.0.1:8001/writing", "writing",
+                  {"topic": "AI agent communication protocols", "research_data": RESEARCH_PENDING}),
+    )
     
-    if not result2.success:
-        print(f"{C.RED}❌ Failed to negotiate with Writing Agent{C.RESET}")
-        return
+    for result, name in ((result1, "Research Agent"), (result2, "Writing Agent")):
+        if not result.success:
+            print(f"{C.RED}❌ Failed to negotiate with {name}{C.RESET}")
+            server.should_exit = True
+            await server_task
+            return
     
+    deal_box("Research Agent", result1.final_price, C.GREEN)
     deal_box("Writing Agent", result2.final_price, C.MAGENTA)
     
     # ─── Summary ──────────────────────────────────────────────────────
@@ -258,37 +291,33 @@ The buyer will negotiate with each agent independently.
     
     section("💸", "PROCESSING PAYMENTS")
     
-    import concurrent.futures
-    
     total_paid = 0.0
     
-    def show_spinner(message: str, done_flag: list):
-        """Show spinner until done_flag[0] is True."""
-        chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-        i = 0
-        while not done_flag[0]:
-            sys.stdout.write(f"\r{C.DIM}  {chars[i % len(chars)]} {message}{C.RESET}")
-            sys.stdout.flush()
-            i += 1
-            time.sleep(0.1)
-        sys.stdout.write("\r" + " " * (len(message) + 10) + "\r")
-        sys.stdout.flush()
-    
-    # Payment 1
-    done1 = [False]
-    spinner_thread1 = threading.Thread(target=show_spinner, args=(f"Paying Research Agent ${result1.final_price:.2f}...", done1))
-    spinner_thread1.start()
-    
+    # One set of chain reads (balance, pending nonce, gas price) for both
+    # transfers. The wallet hands out nonces n and n+1 under its nonce lock,
+    # so the two payments can be broadcast at once.
+    prepared = await buyer_wallet.prepare_transfer()
     payment1 = Payment(
         job_id="research-job",
         amount=result1.final_price,
         buyer_wallet=buyer_wallet,
         seller_address=seller1_wallet.address,
     )
-    pay1 = await payment1.execute()
+    payment2 = Payment(
+        job_id="writing-job",
+        amount=result2.final_price,
+        buyer_wallet=buyer_wallet,
+        seller_address=seller1_wallet.address,
+    )
     
-    done1[0] = True
-    spinner_thread1.join()
+    stop = asyncio.Event()
+    spinner_task = asyncio.create_task(spinner(f"Paying both agents ${total_cost:.2f}...", stop))
+    pay1, pay2 = await asyncio.gather(
+        payment1.execute(prepared=prepared),
+        payment2.execute(prepared=prepared),
+    )
+    stop.set()
+    await spinner_task
     
     if pay1.success:
         print(f"{C.GREEN}  ✅ Research Agent: ${result1.final_price:.2f}{C.RESET}")
@@ -297,24 +326,6 @@ The buyer will negotiate with each agent independently.
     else:
         print(f"{C.RED}  ❌ Research Agent failed: {pay1.error}{C.RESET}")
     
-    await asyncio.sleep(2)  # Wait for nonce to update
-    
-    # Payment 2
-    done2 = [False]
-    spinner_thread2 = threading.Thread(target=show_spinner, args=(f"Paying Writing Agent ${result2.final_price:.2f}...", done2))
-    spinner_thread2.start()
-    
-    payment2 = Payment(
-        job_id="writing-job",
-        amount=result2.final_price,
-        buyer_wallet=buyer_wallet,
-        seller_address=seller1_wallet.address,
-    )
-    pay2 = await payment2.execute()
-    
-    done2[0] = True
-    spinner_thread2.join()
-    
     if pay2.success:
         print(f"{C.MAGENTA}  ✅ Writing Agent: ${result2.final_price:.2f}{C.RESET}")
         print(f"{C.DIM}     {pay2.explorer_url}{C.RESET}")
@@ -326,8 +337,10 @@ The buyer will negotiate with each agent independently.
     
     section("💰", "FINAL BALANCES")
     
-    final_balance = await buyer_wallet.balance("USDC")
-    seller_balance = await seller1_wallet.balance("USDC")
+    final_balance, seller_balance = await asyncio.gather(
+        buyer_wallet.balance("USDC"),
+        seller1_wallet.balance("USDC"),
+    )
     
     print(f"""
   {C.BLUE}Buyer:{C.RESET}   ${final_balance:.2f} USDC {C.DIM}(was ${initial_balance:.2f}, spent ${total_paid:.2f}){C.RESET}
@@ -336,13 +349,21 @@ The buyer will negotiate with each agent independently.
     
     # ─── Task Complete ────────────────────────────────────────────────
     
-    print(f"{C.CYAN}{'═'*70}{C.RESET}")
-    print(f"{C.BOLD}  🚀 Multi-Agent Task Completed!{C.RESET}")
-    print(f"{C.DIM}  • 2 AI agents discovered and negotiated with autonomously{C.RESET}")
-    print(f"{C.DIM}  • {result1.rounds + result2.rounds} total negotiation rounds{C.RESET}")
-    print(f"{C.DIM}  • ${total_paid:.2f} USDC transferred on-chain{C.RESET}")
-    print(f"{C.CYAN}{'═'*70}{C.RESET}\n")
+    sys.stdout.write("\n".join([
+        f"{C.CYAN}{WIDE_RULE}{C.RESET}",
+        f"{C.BOLD}  🚀 Multi-Agent Task Completed!{C.RESET}",
+        f"{C.DIM}  • 2 AI agents discovered and negotiated with autonomously{C.RESET}",
+        f"{C.DIM}  • {result1.rounds + result2.rounds} total negotiation rounds{C.RESET}",
+        f"{C.DIM}  • ${total_paid:.2f} USDC transferred on-chain{C.RESET}",
+        f"{C.CYAN}{WIDE_RULE}{C.RESET}",
+    ]) + "\n\n")
+    sys.stdout.flush()
+    
+    await shutdown()  # close the shared buyer/LLM connections
+    server.should_exit = True
+    await server_task
 
 
 if __name__ == "__main__":
+    install_fast_loop()  # uvloop when installed: pip install apex-protocol[server]
     asyncio.run(run_demo())
\ No newline at end of file
@@ -24,27 +24,37 @@ What happens:
 """
 
 import asyncio
+import os
 import sys
-import time
 from pathlib import Path
 
 # Add parent to path for local development
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 
-def type_text(text: str, delay: float = 0.02):
-    """Print with typing effect."""
-    for char in text:
-        sys.stdout.write(char)
+from apex import create_agent, create_buyer, Negotiated, Fixed, install_fast_loop
+from apex.payments import Wallet
+from apex._json import dumps, loads  # orjson when installed (apex-protocol[fast])
+
+
+async def type_text(text: str, delay: float = 0.02, chunk: int = 4):
+    """Print with typing effect (plain print when piped or APEX_NO_TYPE is set)."""
+    if not sys.stdout.isatty() or os.environ.get("APEX_NO_TYPE"):
+        print(text)
+        return
+    for i in range(0, len(text), chunk):
+        sys.stdout.write(text[i:i + chunk])
         sys.stdout.flush()
-        time.sleep(delay)
+        await asyncio.sleep(delay * chunk)
     print()
 
 
 async def main():
-    from apex import create_agent, create_buyer, Negotiated, Fixed
-    from apex.payments import Wallet
-    
     print()
     print("=" * 65)
     print("  APEX Protocol Demo - Real Payments")
@@ -74,9 +84,11 @@ async def main():
     print("💰 Checking balances...")
     
     try:
-        buyer_balance = await buyer_wallet.balance("USDC")
-        seller_balance = await seller_wallet.balance("USDC")
-        buyer_eth = await buyer_wallet.eth_balance()
+        buyer_balance, seller_balance, buyer_eth = await asyncio.gather(
+            buyer_wallet.balance("USDC"),
+            seller_wallet.balance("USDC"),
+            buyer_wallet.eth_balance(),
+        )
         
         print(f"   Buyer:  ${buyer_balance:.2f} USDC, {buyer_eth:.4f} ETH")
         print(f"   Seller: ${seller_balance:.2f} USDC")
@@ -136,29 +148,21 @@ async def main():
     
     # ─── Start Server in Background ───────────────────────────────────
     
-    import threading
-    import uvicorn
-    from starlette.applications import Starlette
-    from starlette.requests import Request
-    from starlette.responses import JSONResponse
-    from starlette.routing import Route
-    
-    async def handle_apex(request: Request) -> JSONResponse:
-        body = await request.json()
+    async def handle_apex(request: Request) -> Response:
+        body = loads(await request.body())
         response = await seller_agent.handle(body)
-        return JSONResponse(response)
+        return Response(dumps(response), media_type="application/json")
     
     app = Starlette(routes=[
         Route("/apex", handle_apex, methods=["POST"]),
     ])
     
-    server_config = uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="error")
+    server_config = uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="error", access_log=False)
     server = uvicorn.Server(server_config)
     
-    server_thread = threading.Thread(target=server.run, daemon=True)
-    server_thread.start()
-    
-    await asyncio.sleep(1)  # Wait for server
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:  # Wait for server
+        await asyncio.sleep(0.01)
     print("   Server running on http://127.0.0.1:8001/apex")
     print()
     
@@ -213,14 +217,16 @@ async def main():
             print()
         
         print(f"📄 Output:")
-        type_text(f"   {result.output.get('result', result.output)}", delay=0.01)
+        await type_text(f"   {result.output.get('result', result.output)}", delay=0.01)
         
         # Show updated balances
         print()
         print("💰 Updated balances:")
         try:
-            new_buyer = await buyer_wallet.balance("USDC")
-            new_seller = await seller_wallet.balance("USDC")
+            new_buyer, new_seller = await asyncio.gather(
+                buyer_wallet.balance("USDC"),
+                seller_wallet.balance("USDC"),
+            )
             print(f"   Buyer:  ${new_buyer:.2f} USDC (was ${buyer_balance:.2f})")
             print(f"   Seller: ${new_seller:.2f} USDC (was ${seller_balance:.2f})")
         except:
@@ -234,7 +240,11 @@ async def main():
     
     print()
     print("=" * 65)
+    
+    server.should_exit = True
+    await server_task
 
 
 if __name__ == "__main__":
+    install_fast_loop()  # uvloop when installed: pip install apex-protocol[server]
     asyncio.run(main())
@@ -7,14 +7,20 @@ Uses the apex SDK properly - no custom negotiation code.
 import asyncio
 import sys
 import os
-import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 os.environ["APEX_NETWORK"] = "sepolia"
 
-from apex import create_agent, create_buyer, Negotiated
-from apex.payments import Wallet
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from apex import create_agent, create_buyer, Negotiated, install_fast_loop
+from apex.payments import Wallet, Payment
+from apex._json import dumps, loads  # orjson when installed (apex-protocol[fast])
 
 
 # ─── Colors ───────────────────────────────────────────────────────────────────
@@ -42,6 +48,19 @@ def section(emoji: str, text: str):
     print(f"{C.DIM}{'─'*60}{C.RESET}")
 
 
+async def spinner(message: str, stop: asyncio.Event):
+    """Show a spinner until stop is set."""
+    chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+    i = 0
+    while not stop.is_set():
+        sys.stdout.write(f"\r{C.DIM}  {chars[i % len(chars)]} {message}{C.RESET}")
+        sys.stdout.flush()
+        i += 1
+        await asyncio.sleep(0.1)
+    sys.stdout.write("\x1b[2K\r")  # erase the spinner line
+    sys.stdout.flush()
+
+
 async def run_demo():
     header("APEX Protocol — AI Agent Negotiation Demo")
     
@@ -90,20 +109,15 @@ async def run_demo():
     
     # ─── Start Server ─────────────────────────────────────────────────
     
-    import threading
-    import uvicorn
-    from starlette.applications import Starlette
-    from starlette.requests import Request
-    from starlette.responses import JSONResponse
-    from starlette.routing import Route
-    
-    async def handle_apex(request: Request) -> JSONResponse:
-        return JSONResponse(await seller_agent.handle(await request.json()))
+    async def handle_apex(request: Request) -> Response:
+        body = await seller_agent.handle(loads(await request.body()))
+        return Response(dumps(body), media_type="application/json")
     
     app = Starlette(routes=[Route("/apex", handle_apex, methods=["POST"])])
-    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="error"))
-    threading.Thread(target=server.run, daemon=True).start()
-    await asyncio.sleep(1)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="error", access_log=False))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
     
     # ─── Create Buyer (using SDK!) ────────────────────────────────────
     
@@ -143,24 +157,9 @@ async def run_demo():
         # Now process payment with spinner
         section("💸", "PAYMENT")
         
-        import threading
+        stop = asyncio.Event()
+        spinner_task = asyncio.create_task(spinner(f"Sending ${result.final_price:.2f} USDC...", stop))
         
-        def show_spinner(message: str, done_flag: list):
-            chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-            i = 0
-            while not done_flag[0]:
-                sys.stdout.write(f"\r{C.DIM}  {chars[i % len(chars)]} {message}{C.RESET}")
-                sys.stdout.flush()
-                i += 1
-                time.sleep(0.1)
-            sys.stdout.write("\r" + " " * (len(message) + 10) + "\r")
-            sys.stdout.flush()
-        
-        done = [False]
-        spinner_thread = threading.Thread(target=show_spinner, args=(f"Sending ${result.final_price:.2f} USDC...", done))
-        spinner_thread.start()
-        
-        from apex.payments import Payment
         payment = Payment(
             job_id="demo",
             amount=result.final_price,
@@ -169,14 +168,16 @@ async def run_demo():
         )
         pay_result = await payment.execute()
         
-        done[0] = True
-        spinner_thread.join()
+        stop.set()
+        await spinner_task
         
         if pay_result.success:
             print(f"{C.SELLER}✅ Confirmed!{C.RESET} {C.DIM}{pay_result.explorer_url}{C.RESET}")
             
-            new_buyer = await buyer_wallet.balance("USDC")
-            new_seller = await seller_wallet.balance("USDC")
+            new_buyer, new_seller = await asyncio.gather(
+                buyer_wallet.balance("USDC"),
+                seller_wallet.balance("USDC"),
+            )
             print(f"\n{C.BOLD}💰 Balances:{C.RESET}")
             print(f"   {C.BUYER}Buyer:{C.RESET}  ${new_buyer:.2f} {C.DIM}(was ${buyer_usdc:.2f}){C.RESET}")
             print(f"   {C.SELLER}Seller:{C.RESET} ${new_seller:.2f}")
@@ -190,7 +191,11 @@ async def run_demo():
     print(f"\n{C.CYAN}{'─'*60}{C.RESET}")
     print(f"{C.BOLD}🚀 Two AI agents negotiated and transacted autonomously!{C.RESET}")
     print(f"{C.CYAN}{'─'*60}{C.RESET}\n")
+    
+    server.should_exit = True
+    await server_task
 
 
 if __name__ == "__main__":
+    install_fast_loop()  # uvloop when installed: pip install apex-protocol[server]
     asyncio.run(run_demo())
\ No newline at end of file
@@ -235,7 +235,7 @@ async def run(input: dict) -> dict:
     output_path = {repr(config.get('output'))}
     
     # Substitute templates
-    context = {{"input": input, "env": dict(os.environ)}}
+    context = {{"input": input}}
     
     def substitute(template):
         if isinstance(template, str):
@@ -313,7 +313,7 @@ async def run(input: dict) -> dict:
     output_path = {repr(config.get('output'))}
     
     # Substitute templates
-    context = {{"input": input, "env": dict(os.environ)}}
+    context = {{"input": input}}
     
     def substitute(template):
         if isinstance(template, str):
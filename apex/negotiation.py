@@ -23,10 +23,10 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, Literal
 import hashlib
-import json
 import math
 import os
 
+from . import _json
 from .pricing import Negotiated
 
 
@@ -117,7 +117,7 @@ def _exp_concession(
     """Exponential concession curve for algorithmic strategies."""
     t = round / max_rounds
     base = 0.65 * risk
-    factor = Decimal(str(1 - math.exp(-base * t)))
+    factor = Decimal(str(-math.expm1(-base * t)))
     return target - (target - minimum) * factor
 
 
@@ -369,33 +369,40 @@ class NegotiationEngine:
 - Accept if they're at {floor_str} or above
 - Or make final offer at/near {floor_str}"""
 
+        # Only per-job values in the system prompt, so it is byte-identical
+        # every round (providers cache the prefix); the round goes in the user turn
         system_prompt = f"""You are negotiating to sell a service. Be professional and varied in your responses.
 
 YOUR POSITION:
 - Target: {target_str}
 - Floor: {floor_str}
-- Their offer: {offer_str}
-- Last counter: {last_counter_str}
 {task_section}
-{round_guidance}
-
 {self._format_instructions()}
 
 CRITICAL RULES:
-1. Your price MUST be {suggested_str} or LOWER (never higher than last counter!)
+1. Never price above the suggested price for the round (never higher than your last counter!)
 2. Vary your dialogue - don't repeat the same phrases
 3. Reference the actual work involved
 
-Example response style for this round:
-"{example_style}"
-
 Respond with ONLY JSON:
-{{"action": "counter", "price": {suggested:.2f}, "reason": "Your unique 1-2 sentence response"}}
+{{"action": "counter", "price": <your price>, "reason": "Your unique 1-2 sentence response"}}
 {{"action": "accept", "reason": "Brief acceptance"}}
 
 JSON ONLY:"""
 
-        user_prompt = f"Buyer offers {offer_str}. Round {self.round}/{self.max_rounds}."
+        user_prompt = f"""Buyer offers {offer_str}. Round {self.round}/{self.max_rounds}.
+
+- Their offer: {offer_str}
+- Last counter: {last_counter_str}
+
+{round_guidance}
+
+Your price MUST be {suggested_str} or LOWER.
+Example response style for this round:
+"{example_style}"
+
+Suggested JSON:
+{{"action": "counter", "price": {suggested:.2f}, "reason": "Your unique 1-2 sentence response"}}"""
 
         try:
             response = self._call_llm(system_prompt, user_prompt)
@@ -508,7 +515,7 @@ Example: "Given [specific work involved], {counter_str} is fair."
         # Extract JSON
         if "{" in text:
             json_str = text[text.index("{"):text.rindex("}") + 1]
-            data = json.loads(json_str)
+            data = _json.loads(json_str)
         else:
             raise ValueError(f"No JSON in response: {text}")
 
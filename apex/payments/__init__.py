@@ -31,7 +31,7 @@ Example:
     verified = await Payment.verify(result.proof)
 """
 
-from .wallet import Wallet, TransferResult
+from .wallet import Wallet, TransferPrep, TransferResult
 from .settlement import Payment, PaymentProof, PaymentResult, PaymentManager
 from .config import (
     get_network,
@@ -51,6 +51,7 @@ __all__ = [
     
     # Results
     "TransferResult",
+    "TransferPrep",
     "PaymentResult", 
     "PaymentProof",
     
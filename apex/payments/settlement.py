@@ -34,7 +34,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from decimal import Decimal
 
-from .wallet import Wallet, TransferResult
+from .wallet import Wallet, TransferPrep, TransferResult
 from .config import get_network, get_explorer_url, USDC_DECIMALS, ERC20_ABI, DEFAULT_NETWORK
 
 from web3 import Web3
@@ -78,6 +78,7 @@ class PaymentResult:
     explorer_url: Optional[str] = None
     error: Optional[str] = None
     gas_used: Optional[int] = None
+    confirmed: bool = True  # False: transfer broadcast but not yet mined
 
 
 class Payment:
@@ -114,9 +115,19 @@ class Payment:
         
         self._result: Optional[PaymentResult] = None
     
-    async def execute(self) -> PaymentResult:
+    async def execute(
+        self,
+        wait_for_receipt: bool = True,
+        prepared: Optional[TransferPrep] = None,
+    ) -> PaymentResult:
         """Execute the payment.
         
+        Args:
+            wait_for_receipt: Wait for the transfer to be mined. If False,
+                succeed as soon as it is broadcast.
+            prepared: Chain reads from buyer_wallet.prepare_transfer(), to skip
+                fetching balance, nonce and gas price here
+        
         Returns:
             PaymentResult with success status and proof
         """
@@ -127,7 +138,10 @@ class Payment:
             )
         
         # Check balance first
-        balance = await self.buyer_wallet.balance("USDC")
+        if prepared is not None:
+            balance = prepared.balance_raw / (10 ** USDC_DECIMALS)
+        else:
+            balance = await self.buyer_wallet.balance("USDC")
         if balance < self.amount:
             return PaymentResult(
                 success=False,
@@ -139,6 +153,8 @@ class Payment:
             to=self.seller_address,
             amount=self.amount,
             token="USDC",
+            wait_for_receipt=wait_for_receipt,
+            prepared=prepared,
         )
         
         if not transfer_result.success:
@@ -165,6 +181,7 @@ class Payment:
             tx_hash=transfer_result.tx_hash,
             explorer_url=transfer_result.explorer_url,
             gas_used=transfer_result.gas_used,
+            confirmed=transfer_result.confirmed,
         )
         
         return self._result
@@ -17,13 +17,19 @@ Example:
     
     # Transfer
     tx_hash = await wallet.transfer(to="0x...", amount=12.50)
+    
+    # Broadcast through extra RPC nodes too (first to accept wins)
+    wallet = Wallet.from_env(rpc_endpoints=["https://base-rpc.example.com"])
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
@@ -47,14 +53,31 @@ class TransferResult:
     explorer_url: Optional[str] = None
     error: Optional[str] = None
     gas_used: Optional[int] = None
+    confirmed: bool = True  # False: broadcast but not yet mined (still success=True)
+
+
+@dataclass
+class TransferPrep:
+    """Chain reads for an upcoming transfer, fetched ahead of time (see Wallet.prepare_transfer)."""
+    balance_raw: int  # USDC balance, 6 decimals
+    chain_nonce: int  # pending transaction count
+    gas_price: int  # wei, already bumped 20%
 
 
 class Wallet:
     """Agent wallet for signing transactions and managing funds."""
     
-    def __init__(self, account: LocalAccount, network: str = DEFAULT_NETWORK):
+    def __init__(
+        self,
+        account: LocalAccount,
+        network: str = DEFAULT_NETWORK,
+        rpc_endpoints: Optional[Sequence[str]] = None,
+    ):
         """Initialize wallet with an eth-account LocalAccount.
         
+        rpc_endpoints are extra RPC URLs that signed transfers are broadcast to,
+        in parallel with the network's default RPC.
+        
         Use class methods to create:
             Wallet.generate()
             Wallet.from_private_key(key)
@@ -64,9 +87,12 @@ class Wallet:
         self._network = network
         self._web3: Optional[Web3] = None
         self._last_nonce: Optional[int] = None  # Track nonce locally
+        self._nonce_lock = threading.Lock()
+        self.rpc_endpoints: list[str] = list(rpc_endpoints or [])
+        self._broadcast_web3s: dict[str, Web3] = {}
     
     @classmethod
-    def generate(cls, network: str = DEFAULT_NETWORK) -> "Wallet":
+    def generate(cls, network: str = DEFAULT_NETWORK, rpc_endpoints: Optional[Sequence[str]] = None) -> "Wallet":
         """Generate a new random wallet.
         
         Returns:
@@ -78,15 +104,21 @@ class Wallet:
             print(f"Private key: {wallet.private_key}")  # Save this!
         """
         account = Account.create()
-        return cls(account, network)
+        return cls(account, network, rpc_endpoints)
     
     @classmethod
-    def from_private_key(cls, private_key: str, network: str = DEFAULT_NETWORK) -> "Wallet":
+    def from_private_key(
+        cls,
+        private_key: str,
+        network: str = DEFAULT_NETWORK,
+        rpc_endpoints: Optional[Sequence[str]] = None,
+    ) -> "Wallet":
         """Load wallet from a private key.
         
         Args:
             private_key: Hex-encoded private key (with or without 0x prefix)
             network: Network to use (default: base)
+            rpc_endpoints: Extra RPC URLs to broadcast transfers to
             
         Returns:
             Wallet instance
@@ -99,15 +131,21 @@ class Wallet:
             private_key = "0x" + private_key
         
         account = Account.from_key(private_key)
-        return cls(account, network)
+        return cls(account, network, rpc_endpoints)
     
     @classmethod
-    def from_env(cls, var_name: str = "APEX_PRIVATE_KEY", network: str = DEFAULT_NETWORK) -> "Wallet":
+    def from_env(
+        cls,
+        var_name: str = "APEX_PRIVATE_KEY",
+        network: str = DEFAULT_NETWORK,
+        rpc_endpoints: Optional[Sequence[str]] = None,
+    ) -> "Wallet":
         """Load wallet from an environment variable.
         
         Args:
             var_name: Environment variable name containing private key
             network: Network to use (default: base)
+            rpc_endpoints: Extra RPC URLs to broadcast transfers to
             
         Returns:
             Wallet instance
@@ -126,7 +164,7 @@ class Wallet:
         if not private_key:
             raise ValueError(f"Environment variable {var_name} not set")
         
-        return cls.from_private_key(private_key, network)
+        return cls.from_private_key(private_key, network, rpc_endpoints)
     
     @property
     def address(self) -> str:
@@ -149,12 +187,47 @@ class Wallet:
     def _get_web3(self) -> Web3:
         """Get or create Web3 instance."""
         if self._web3 is None:
-            config = get_network(self._network)
-            self._web3 = Web3(Web3.HTTPProvider(config.rpc_url))
-            # Add POA middleware for Base
-            self._web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+            self._new_web3()
         return self._web3
     
+    def _new_web3(self) -> Web3:
+        """Replace the cached Web3 instance with a fresh connection."""
+        config = get_network(self._network)
+        w3 = Web3(Web3.HTTPProvider(config.rpc_url))
+        # Add POA middleware for Base
+        w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        self._web3 = w3
+        return w3
+    
+    def _send_raw(self, w3: Web3, raw_tx: bytes) -> bytes:
+        """Broadcast a signed transaction; with rpc_endpoints, first node to accept wins.
+        
+        Every node gets the same signed bytes, so they all agree on the tx hash and
+        slower nodes answering "already known" is harmless. Stragglers keep running
+        in the background to help propagation.
+        """
+        if not self.rpc_endpoints:
+            return w3.eth.send_raw_transaction(raw_tx)
+        
+        targets = [w3]
+        for url in self.rpc_endpoints:
+            node = self._broadcast_web3s.get(url)
+            if node is None:
+                node = self._broadcast_web3s[url] = Web3(Web3.HTTPProvider(url))
+            targets.append(node)
+        
+        executor = ThreadPoolExecutor(max_workers=len(targets))
+        try:
+            futures = [executor.submit(node.eth.send_raw_transaction, raw_tx) for node in targets]
+            error: Optional[BaseException] = None
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is None:
+                    return future.result()
+            raise error
+        finally:
+            executor.shutdown(wait=False)
+    
     async def balance(self, token: str = "USDC") -> float:
         """Get token balance.
         
@@ -176,8 +249,8 @@ class Wallet:
             abi=ERC20_ABI,
         )
         
-        # Get balance (returns integer with 6 decimals)
-        raw_balance = usdc.functions.balanceOf(self.address).call()
+        # Get balance (returns integer with 6 decimals); web3 is blocking, keep it off the loop
+        raw_balance = await asyncio.to_thread(usdc.functions.balanceOf(self.address).call)
         
         # Convert to human-readable
         return raw_balance / (10 ** USDC_DECIMALS)
@@ -185,15 +258,39 @@ class Wallet:
     async def eth_balance(self) -> float:
         """Get ETH balance (for gas)."""
         w3 = self._get_web3()
-        raw_balance = w3.eth.get_balance(self.address)
+        raw_balance = await asyncio.to_thread(w3.eth.get_balance, self.address)
         return w3.from_wei(raw_balance, "ether")
     
+    async def prepare_transfer(self) -> TransferPrep:
+        """Fetch balance, nonce and gas price for a transfer that is about to happen.
+        
+        Lets callers overlap these RPC round trips with other work (e.g. the
+        final negotiation round) and pass the result to transfer(prepared=...).
+        """
+        return await asyncio.to_thread(self._prepare_transfer)
+    
+    def _prepare_transfer(self) -> TransferPrep:
+        """Blocking chain reads for prepare_transfer."""
+        w3 = self._get_web3()
+        config = get_network(self._network)
+        usdc = w3.eth.contract(
+            address=Web3.to_checksum_address(config.usdc_address),
+            abi=ERC20_ABI,
+        )
+        return TransferPrep(
+            balance_raw=usdc.functions.balanceOf(self.address).call(),
+            chain_nonce=w3.eth.get_transaction_count(self.address, "pending"),
+            gas_price=int(w3.eth.gas_price * 1.2),
+        )
+    
     async def transfer(
         self,
         to: str,
         amount: float,
         token: str = "USDC",
         gas_limit: Optional[int] = None,
+        wait_for_receipt: bool = True,
+        prepared: Optional[TransferPrep] = None,
     ) -> TransferResult:
         """Transfer tokens to another address.
         
@@ -202,6 +299,10 @@ class Wallet:
             amount: Amount to send (human-readable, e.g., 12.50)
             token: Token symbol (currently only USDC)
             gas_limit: Optional gas limit override
+            wait_for_receipt: Wait (up to 30s) for the transaction to be mined.
+                If False, return as soon as it is broadcast (pending).
+            prepared: Chain reads from prepare_transfer(), used instead of
+                fetching balance, nonce and gas price again
             
         Returns:
             TransferResult with tx_hash and explorer URL
@@ -214,10 +315,21 @@ class Wallet:
         if token != "USDC":
             raise ValueError(f"Unsupported token: {token}. Only USDC supported.")
         
+        # web3 calls block; run them in a worker thread so the event loop keeps going
+        return await asyncio.to_thread(self._transfer, to, amount, gas_limit, wait_for_receipt, prepared)
+    
+    def _transfer(
+        self,
+        to: str,
+        amount: float,
+        gas_limit: Optional[int],
+        wait_for_receipt: bool,
+        prepared: Optional[TransferPrep] = None,
+    ) -> TransferResult:
+        """Blocking USDC transfer (see transfer)."""
         try:
             # Force fresh Web3 connection to avoid stale nonce
-            self._web3 = None
-            w3 = self._get_web3()
+            w3 = self._new_web3()
             config = get_network(self._network)
             
             # Get USDC contract
@@ -230,7 +342,10 @@ class Wallet:
             raw_amount = int(amount * (10 ** USDC_DECIMALS))
             
             # Check balance
-            current_balance = usdc.functions.balanceOf(self.address).call()
+            if prepared is not None:
+                current_balance = prepared.balance_raw
+            else:
+                current_balance = usdc.functions.balanceOf(self.address).call()
             if current_balance < raw_amount:
                 return TransferResult(
                     success=False,
@@ -240,39 +355,55 @@ class Wallet:
             # Build transaction
             to_address = Web3.to_checksum_address(to)
             
-            # Get nonce - use local tracking to avoid collisions
-            chain_nonce = w3.eth.get_transaction_count(self.address, "pending")
-            if self._last_nonce is not None and self._last_nonce >= chain_nonce:
-                nonce = self._last_nonce + 1
-            else:
-                nonce = chain_nonce
-            
-            # Get gas price and bump by 20% to avoid replacement issues
-            gas_price = int(w3.eth.gas_price * 1.2)
-            
-            # Build transfer call
-            tx = usdc.functions.transfer(to_address, raw_amount).build_transaction({
-                "chainId": config.chain_id,
-                "from": self.address,
-                "nonce": nonce,
-                "gasPrice": gas_price,
-                "gas": gas_limit or 100000,  # USDC transfers typically use ~50k
-            })
-            
-            # Sign transaction
-            signed_tx = w3.eth.account.sign_transaction(tx, self._account.key)
-            
-            # Send transaction
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_hash_hex = "0x" + tx_hash.hex()
-            
-            # Update local nonce tracking
-            self._last_nonce = nonce
+            # Nonce allocation and broadcast are serialized so concurrent transfers
+            # from this wallet never reuse a nonce
+            with self._nonce_lock:
+                # Get nonce - use local tracking to avoid collisions
+                if prepared is not None:
+                    chain_nonce = prepared.chain_nonce
+                else:
+                    chain_nonce = w3.eth.get_transaction_count(self.address, "pending")
+                if self._last_nonce is not None and self._last_nonce >= chain_nonce:
+                    nonce = self._last_nonce + 1
+                else:
+                    nonce = chain_nonce
+                
+                # Get gas price and bump by 20% to avoid replacement issues
+                if prepared is not None:
+                    gas_price = prepared.gas_price
+                else:
+                    gas_price = int(w3.eth.gas_price * 1.2)
+                
+                # Build transfer call
+                tx = usdc.functions.transfer(to_address, raw_amount).build_transaction({
+                    "chainId": config.chain_id,
+                    "from": self.address,
+                    "nonce": nonce,
+                    "gasPrice": gas_price,
+                    "gas": gas_limit or 100000,  # USDC transfers typically use ~50k
+                })
+                
+                # Sign transaction
+                signed_tx = w3.eth.account.sign_transaction(tx, self._account.key)
+                
+                # Send transaction
+                tx_hash = self._send_raw(w3, signed_tx.raw_transaction)
+                tx_hash_hex = "0x" + tx_hash.hex()
+                
+                # Update local nonce tracking
+                self._last_nonce = nonce
             
-            # Transaction sent - return immediately with pending status
-            # Don't wait for confirmation to avoid hanging
             explorer_url = get_explorer_url(tx_hash_hex, self._network)
             
+            if not wait_for_receipt:
+                # Broadcast only - caller doesn't want to block on inclusion
+                return TransferResult(
+                    success=True,
+                    tx_hash=tx_hash_hex,
+                    explorer_url=explorer_url,
+                    confirmed=False,
+                )
+            
             try:
                 # Quick wait - 30 seconds max
                 receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
@@ -297,7 +428,7 @@ class Wallet:
                     success=True,
                     tx_hash=tx_hash_hex,
                     explorer_url=explorer_url,
-                    error="Pending confirmation",
+                    confirmed=False,
                 )
         
         except Exception as e:
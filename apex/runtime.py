@@ -0,0 +1,32 @@
+"""APEX Runtime - Event loop tuning for I/O-heavy buyers and agents.
+
+Example:
+    import asyncio
+    import apex
+
+    apex.install_fast_loop()  # before asyncio.run()
+    asyncio.run(main())
+"""
+
+import asyncio
+
+
+def install_fast_loop() -> bool:
+    """Use uvloop for event loops created after this call, if it is installed.
+
+    Buyers spend nearly all their time waiting on HTTP (sellers, LLMs, chain
+    RPC), which is where uvloop's libuv-based loop is fastest. Install with
+    pip install apex-protocol[server]. agent.serve() already picks uvloop up
+    on its own.
+
+    Returns:
+        True if uvloop was installed, False if it isn't available (the
+        default asyncio loop stays in place).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -23,9 +23,14 @@ from typing import Any
 
 import httpx
 
+from . import _json
 from .pricing import Pricing, Fixed, Negotiated
 from .negotiation import NegotiationEngine, NegotiationState
 
+_TEMPLATE_RE = re.compile(r"\{\{(.+?)\}\}")
+# $VAR in a curl header (rewritten to {{env.VAR}})
+_ENV_RE = re.compile(r"\$(\w+)")
+
 
 def _substitute(template: Any, context: dict) -> Any:
     """Substitute {{variable}} placeholders in template."""
@@ -52,7 +57,7 @@ def _substitute(template: Any, context: dict) -> Any:
                     value = value.get(part, "")
             return str(value) if value else ""
         
-        return re.sub(r"\{\{(.+?)\}\}", replace, template)
+        return _TEMPLATE_RE.sub(replace, template)
     
     elif isinstance(template, dict):
         return {k: _substitute(v, context) for k, v in template.items()}
@@ -106,7 +111,7 @@ class WrappedAgent:
     
     async def run(self, input: dict) -> dict:
         """Execute the wrapped endpoint."""
-        context = {"input": input, "env": dict(os.environ)}
+        context = {"input": input}
         
         # Build request
         url = self.endpoint
@@ -336,15 +341,15 @@ class WrappedAgent:
         import uvicorn
         from starlette.applications import Starlette
         from starlette.requests import Request
-        from starlette.responses import JSONResponse
+        from starlette.responses import JSONResponse, Response
         from starlette.routing import Route
         
         agent = self
         
-        async def handle_apex(request: Request) -> JSONResponse:
-            body = await request.json()
+        async def handle_apex(request: Request) -> Response:
+            body = _json.loads(await request.body())
             response = await agent.handle(body)
-            return JSONResponse(response)
+            return Response(_json.dumps(response), media_type="application/json")
         
         async def health(request: Request) -> JSONResponse:
             return JSONResponse({"status": "ok", "agent": agent.name})
@@ -516,16 +521,15 @@ def _parse_curl(curl: str) -> tuple[str, str, dict, dict | None]:
             if ":" in header:
                 key, value = header.split(":", 1)
                 # Convert $VAR to {{env.VAR}}
-                value = re.sub(r"\$(\w+)", r"{{env.\1}}", value.strip())
+                value = _ENV_RE.sub(r"{{env.\1}}", value.strip())
                 headers[key.strip()] = value
         elif token in ("-d", "--data", "--data-raw"):
             i += 1
             data = tokens[i]
             # Try to parse as JSON
             try:
-                import json
-                body = json.loads(data)
-            except:
+                body = _json.loads(data)
+            except _json.JSONDecodeError:
                 body = {"data": data}
         elif token.startswith("http"):
             endpoint = token